@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Debug token generation and parsing for DreamBerd snippets
+Usage: python debug/debug_dreamberd.py [--tokens] [--parse] [code ...]
+"""
+
+import os
+import sys
+import argparse
+from functools import lru_cache
+
+# Add src directory to path so we can import dreamberd
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from dreamberd_lexer import DreamBerdLexer
+from dreamberd_parser import DreamBerdParser
+
+# Default test cases
+TOKEN_CASES = [
+    "const const const x = 42",
+    "var x = 5",
+    "++x",
+    "--y",
+]
+
+PARSE_CASES = [
+    "const const const x = 42!",
+    "var x = 5!",
+    "++x!",
+    "print(42)!",
+]
+
+# One lexer is rewound for every snippet instead of building a new one each time
+_lexer = DreamBerdLexer("")
+
+
+@lru_cache(maxsize=None)
+def tokenize_cached(code: str):
+    """Tokenize code once; repeated snippets reuse the earlier result."""
+    _lexer.reset(code)
+    return tuple(_lexer.tokenize())
+
+
+def print_tokens(tokens):
+    print("Tokens:")
+    for i, token in enumerate(tokens):
+        print(f"  {i}: {token.type} = {repr(token.value)} at {token.line}:{token.column}")
+
+
+def debug_tokens(code: str):
+    """Debug what tokens are generated for code."""
+    print(f"Code: {repr(code)}")
+    print_tokens(tokenize_cached(code))
+    print()
+
+
+def debug_parse(code: str):
+    """Debug parsing of code, showing the tokens if it fails."""
+    print(f"Code: {repr(code)}")
+    try:
+        ast = DreamBerdParser(list(tokenize_cached(code))).parse()
+        print(f"AST: {ast}")
+        print("Success!")
+    except Exception as e:
+        print(f"Error: {e}")
+        print_tokens(tokenize_cached(code))
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Debug the DreamBerd lexer and parser')
+    parser.add_argument('code', nargs='*', help='DreamBerd snippets (defaults to built-in cases)')
+    parser.add_argument('--tokens', action='store_true', help='Show the tokens for each snippet')
+    parser.add_argument('--parse', action='store_true', help='Parse each snippet and show the AST')
+    args = parser.parse_args()
+    
+    # Without a flag, do both
+    if not args.tokens and not args.parse:
+        args.tokens = args.parse = True
+    
+    if args.tokens:
+        for code in args.code or TOKEN_CASES:
+            debug_tokens(code)
+    
+    if args.parse:
+        for code in args.code or PARSE_CASES:
+            debug_parse(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,17 +25,15 @@ def main():
         sys.exit(1)
     
     try:
-        # Read the file content
-        with open(filename, 'r', encoding='utf-8') as f:
-            code = f.read()
+        # Read the file content in one go and decode it once
+        with open(filename, 'rb') as f:
+            code = f.read().decode('utf-8')
+        if '\r' in code:
+            # Same newline handling as text mode
+            code = code.replace('\r\n', '\n').replace('\r', '\n')
         
-        # Run the DreamBerd code
-        output = run_dreamberd(code)
-        
-        # Print the output
-        if output:
-            for line in output:
-                print(line)
+        # Run the DreamBerd code, printing its output as it is produced
+        run_dreamberd(code, cache_tokens=True, echo=True)
     except Exception as e:
         print(f"Error executing {filename}: {e}")
         sys.exit(1)
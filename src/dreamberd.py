@@ -1,6 +1,10 @@
 """
 DreamBerd/Gulf of Mexico Interpreter
 Main entry point for running DreamBerd programs.
+
+The interpreter is plain Python with no C extensions, so it also runs under
+PyPy 3.10+ (pypy3 src/dreamberd.py program.db), which is the fast option for
+long-running programs.
 """
 
 import sys
@@ -9,6 +13,46 @@ from pathlib import Path
 from dreamberd_interpreter import run_dreamberd, DreamBerdError
 
 
+HELP_TEXT = """
+DreamBerd/Gulf of Mexico Language Features:
+
+Variables:
+  const const name = "Luke"!     # Constant constant
+  const var name = "Luke"!       # Constant variable (editable)
+  var const name = "Luke"!       # Variable constant (reassignable)
+  var var name = "Luke"!         # Variable variable
+
+Arrays (start at -1):
+  const const scores = [3, 2, 5]!
+  print(scores[-1])!             # 3
+  print(scores[0])!              # 2
+
+Functions:
+  function add(a, b) => a + b!
+  func multiply(a, b) => a * b!
+  fun subtract(a, b) => a - b!
+
+Exclamation Marks:
+  print("Hello")!                # Normal statement
+  print("Hello")!!!             # Higher priority
+  print("Hello")?               # Debug mode
+
+Equality Levels:
+  3 = 3.14!                     # Very loose (true)
+  "3" == 3!                     # Loose (true) 
+  "3" === 3!                    # Strict (false)
+  3 ==== 3!                     # Super strict (true)
+
+Special Values:
+  true, false, maybe            # Booleans
+  undefined, null               # Special values
+
+Example Programs:
+  const const name = "World"!
+  print("Hello " + name)!
+"""
+
+
 def main():
     parser = argparse.ArgumentParser(description='DreamBerd/Gulf of Mexico Interpreter')
     parser.add_argument('file', nargs='?', help='DreamBerd source file to run')
@@ -21,9 +65,7 @@ def main():
     if args.code:
         # Execute code directly
         try:
-            output = run_dreamberd(args.code)
-            for line in output:
-                print(line)
+            run_dreamberd(args.code, echo=True)
         except DreamBerdError as e:
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
@@ -37,9 +79,7 @@ def main():
                 sys.exit(1)
             
             source = file_path.read_text(encoding='utf-8')
-            output = run_dreamberd(source)
-            for line in output:
-                print(line)
+            run_dreamberd(source, cache_tokens=True, echo=True)
         except DreamBerdError as e:
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
@@ -65,26 +105,27 @@ def interactive_mode():
     while True:
         try:
             code = input(">>> ")
+            command = code.lower()
             
-            if code.lower() in ('exit', 'quit'):
+            if command in ('exit', 'quit'):
                 print("Goodbye!")
                 break
             
-            if code.lower() == 'help':
+            if command == 'help':
                 print_help()
                 continue
             
-            if not code.strip():
+            # Only the trailing whitespace matters for the checks below
+            stripped = code.rstrip()
+            if not stripped:
                 continue
             
             # Add exclamation mark if missing (AEMI feature)
-            if not code.strip().endswith(('!', '?')):
+            if stripped[-1] not in '!?':
                 code += '!'
             
             try:
-                output = run_dreamberd(code)
-                for line in output:
-                    print(line)
+                run_dreamberd(code, echo=True)
             except DreamBerdError as e:
                 print(f"Error: {e}")
         
@@ -97,44 +138,7 @@ def interactive_mode():
 
 def print_help():
     """Print help information."""
-    print("""
-DreamBerd/Gulf of Mexico Language Features:
-
-Variables:
-  const const name = "Luke"!     # Constant constant
-  const var name = "Luke"!       # Constant variable (editable)
-  var const name = "Luke"!       # Variable constant (reassignable)
-  var var name = "Luke"!         # Variable variable
-
-Arrays (start at -1):
-  const const scores = [3, 2, 5]!
-  print(scores[-1])!             # 3
-  print(scores[0])!              # 2
-
-Functions:
-  function add(a, b) => a + b!
-  func multiply(a, b) => a * b!
-  fun subtract(a, b) => a - b!
-
-Exclamation Marks:
-  print("Hello")!                # Normal statement
-  print("Hello")!!!             # Higher priority
-  print("Hello")?               # Debug mode
-
-Equality Levels:
-  3 = 3.14!                     # Very loose (true)
-  "3" == 3!                     # Loose (true) 
-  "3" === 3!                    # Strict (false)
-  3 ==== 3!                     # Super strict (true)
-
-Special Values:
-  true, false, maybe            # Booleans
-  undefined, null               # Special values
-
-Example Programs:
-  const const name = "World"!
-  print("Hello " + name)!
-""")
+    print(HELP_TEXT)
 
 
 if __name__ == '__main__':
@@ -5,123 +5,130 @@ Abstract Syntax Tree node definitions for the DreamBerd language.
 
 from abc import ABC, abstractmethod
 from typing import List, Optional, Any, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 class ASTNode(ABC):
     """Base class for all AST nodes."""
-    pass
+    __slots__ = ()
 
 
 class Expression(ASTNode):
     """Base class for expressions."""
-    pass
+    __slots__ = ()
 
 
 class Statement(ASTNode):
     """Base class for statements."""
-    pass
+    __slots__ = ()
 
 
 # Literals
-@dataclass
+@dataclass(slots=True)
 class NumberLiteral(Expression):
-    value: Union[int, float, str]  # str for fractions like "1/2"
+    value: Union[int, float, str]  # str for text the parser could not evaluate, like "1.2.3"
 
 
-@dataclass
+@dataclass(slots=True)
 class StringLiteral(Expression):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BooleanLiteral(Expression):
     value: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class MaybeLiteral(Expression):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class UndefinedLiteral(Expression):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class NullLiteral(Expression):
     pass
 
 
 # Identifiers
-@dataclass
+@dataclass(slots=True)
 class Identifier(Expression):
     name: str
 
 
 # Arrays
-@dataclass
+@dataclass(slots=True)
 class ArrayLiteral(Expression):
     elements: List[Expression]
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayAccess(Expression):
     array: Expression
     index: Expression
 
 
 # Binary operations
-@dataclass
+@dataclass(slots=True)
 class BinaryOperation(Expression):
     left: Expression
     operator: str
     right: Expression
 
 
-@dataclass
+# a + b + c as one node; operands are folded left to right
+@dataclass(slots=True)
+class NAryOperation(Expression):
+    operator: str
+    operands: List[Expression]
+
+
+@dataclass(slots=True)
 class UnaryOperation(Expression):
     operator: str
     operand: Expression
 
 
 # Assignment
-@dataclass
+@dataclass(slots=True)
 class Assignment(Expression):
     target: Expression
     value: Expression
 
 
 # Increment/Decrement
-@dataclass
+@dataclass(slots=True)
 class IncrementExpression(Expression):
     target: Expression
     is_prefix: bool = True  # True for ++x, False for x++
 
 
-@dataclass
+@dataclass(slots=True)
 class DecrementExpression(Expression):
     target: Expression
     is_prefix: bool = True  # True for --x, False for x--
 
 
 # Function calls
-@dataclass
+@dataclass(slots=True)
 class FunctionCall(Expression):
     function: Expression
     arguments: List[Expression]
     
     
 # Member access
-@dataclass
+@dataclass(slots=True)
 class MemberAccess(Expression):
     object: Expression
     property: str
 
 
 # Method calls for string operations
-@dataclass
+@dataclass(slots=True)
 class MethodCall(Expression):
     object: Expression
     method_name: str
@@ -129,7 +136,7 @@ class MethodCall(Expression):
 
 
 # Variable declarations
-@dataclass
+@dataclass(slots=True)
 class VariableDeclaration(Statement):
     const_count: int  # Number of 'const' keywords
     var_count: int    # Number of 'var' keywords
@@ -141,7 +148,7 @@ class VariableDeclaration(Statement):
 
 
 # Function declarations
-@dataclass
+@dataclass(slots=True)
 class FunctionDeclaration(Statement):
     keyword: str  # 'function', 'func', 'fun', 'fn', 'functi', 'f', 'union'
     name: str
@@ -151,7 +158,7 @@ class FunctionDeclaration(Statement):
 
 
 # Class declarations
-@dataclass
+@dataclass(slots=True)
 class ClassDeclaration(Statement):
     keyword: str  # 'class' or 'className'
     name: str
@@ -159,112 +166,112 @@ class ClassDeclaration(Statement):
 
 
 # Control flow
-@dataclass
+@dataclass(slots=True)
 class IfStatement(Statement):
     condition: Expression
     then_body: List[Statement]
     else_body: Optional[List[Statement]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WhenStatement(Statement):
     condition: Expression  # Usually an assignment like (health = 0)
     body: List[Statement]
 
 
 # Return statement
-@dataclass
+@dataclass(slots=True)
 class ReturnStatement(Statement):
     value: Optional[Expression] = None
 
 
 # Print statement
-@dataclass
+@dataclass(slots=True)
 class PrintStatement(Statement):
     value: Expression
     is_debug: bool = False  # True if using ? instead of !
 
 
 # Delete statement
-@dataclass
+@dataclass(slots=True)
 class DeleteStatement(Statement):
     target: Expression
 
 
 # Import/Export
-@dataclass
+@dataclass(slots=True)
 class ImportStatement(Statement):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportStatement(Statement):
     name: str
     target_file: str
 
 
 # Temporal operations
-@dataclass
+@dataclass(slots=True)
 class PreviousExpression(Expression):
     target: Expression
 
 
-@dataclass
+@dataclass(slots=True)
 class NextExpression(Expression):
     target: Expression
 
 
-@dataclass
+@dataclass(slots=True)
 class CurrentExpression(Expression):
     target: Expression
 
 
 # Reverse statement
-@dataclass
+@dataclass(slots=True)
 class ReverseStatement(Statement):
     pass
 
 
 # Signals
-@dataclass
+@dataclass(slots=True)
 class UseExpression(Expression):
     initial_value: Expression
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalCall(Expression):
     signal: Expression
     arguments: List[Expression]
 
 
 # New/instantiation
-@dataclass
+@dataclass(slots=True)
 class NewExpression(Expression):
     class_name: str
     arguments: List[Expression]
 
 
 # Await
-@dataclass
+@dataclass(slots=True)
 class AwaitExpression(Expression):
     expression: Expression
 
 
 # File structure
-@dataclass
+@dataclass(slots=True)
 class FileBlock(Statement):
     name: Optional[str]
     body: List[Statement]
 
 
 # Program (root)
-@dataclass
+@dataclass(slots=True)
 class Program(ASTNode):
     body: List[Statement]
 
 
 # Global immutable constant (const const const)
-@dataclass
+@dataclass(slots=True)
 class GlobalConstantDeclaration(Statement):
     name: str
     value: Expression
@@ -272,7 +279,7 @@ class GlobalConstantDeclaration(Statement):
 
 
 # String interpolation
-@dataclass
+@dataclass(slots=True)
 class StringInterpolation(Expression):
     template: str
     expressions: List[Expression]
@@ -280,13 +287,13 @@ class StringInterpolation(Expression):
 
 
 # Noop statement
-@dataclass
+@dataclass(slots=True)
 class NoopStatement(Statement):
     content: str  # The string content used as noop
 
 
 # Expression statement (for expressions used as statements)
-@dataclass
+@dataclass(slots=True)
 class ExpressionStatement(Statement):
     expression: Expression
     priority: int = 0  # From exclamation marks
@@ -294,7 +301,7 @@ class ExpressionStatement(Statement):
 
 
 # DBX (HTML-like) elements
-@dataclass  
+@dataclass(slots=True)
 class DBXElement(Expression):
     tag: str
     attributes: dict
@@ -302,8 +309,8 @@ class DBXElement(Expression):
 
 
 # Rich text elements
-@dataclass
+@dataclass(slots=True)
 class RichTextElement(Expression):
     tag: str  # 'b', 'i', 'a', etc.
     content: str
-    attributes: dict = None
\ No newline at end of file
+    attributes: dict = field(default_factory=dict)
\ No newline at end of file
@@ -3,33 +3,98 @@ DreamBerd/Gulf of Mexico Interpreter
 Evaluates DreamBerd AST nodes and executes the program.
 """
 
-import math
+import operator
 import time
 import re
-from typing import Any, Dict, List, Optional, Union, Callable
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Callable
+import dreamberd_ast
 from dreamberd_ast import *
 from dreamberd_parser import parse_dreamberd
 
 
+# Lifetimes like 2, -3, 20s, 1.5m or 1h
+_LIFETIME_RE = re.compile(r'-?(\d+(?:\.\d+)?)([smh]?)')
+_LIFETIME_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600}
+
+
+@lru_cache(maxsize=None)
+def _lifetime_seconds(lifetime_str: str) -> Optional[float]:
+    """Offset in seconds from declaration to expiry, or None if it never expires.
+    
+    Depends only on the lifetime text, so each distinct lifetime is parsed
+    once however many times its declaration runs.
+    """
+    if lifetime_str.lower() == 'infinity':
+        return None  # Never expires
+    
+    match = _LIFETIME_RE.fullmatch(lifetime_str)
+    if match is None:
+        return None
+    
+    # Negative lifetimes (variable hoisting) count the same span as positive
+    # ones; this is a special case we'll handle differently
+    amount, unit = match.groups()
+    # A bare number is a number of lines (simplified: 1 second per line)
+    return float(amount) * _LIFETIME_UNITS[unit]
+
+
+_ARITHMETIC_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '^': operator.pow,
+    '%': operator.mod,
+}
+
+_COMPARISON_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    '=': lambda left, right: abs(left - right) < 0.5,  # Very loose equality: close enough
+    '==': lambda left, right: str(left) == str(right),  # Loose equality
+    '===': lambda left, right: left == right and type(left) == type(right),  # Strict equality
+    '====': operator.is_,  # Super strict equality (reference equality)
+    '!=': operator.ne,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+
+# The lexer interns operator spellings with sys.intern; interning the keys too
+# lets the multi-character ones (==, <=, ...) match on identity
+_ARITHMETIC_OPERATORS = {sys.intern(op): apply for op, apply in _ARITHMETIC_OPERATORS.items()}
+_COMPARISON_OPERATORS = {sys.intern(op): apply for op, apply in _COMPARISON_OPERATORS.items()}
+
+# Operators applied directly to their operands, with no deleted-value or
+# fraction handling; everything else goes through evaluate_arithmetic
+_DIRECT_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    **_COMPARISON_OPERATORS,
+    sys.intern('&&'): lambda left, right: left and right,
+    sys.intern('||'): lambda left, right: left or right,
+}
+
+
 class DreamBerdValue:
     """Wrapper for DreamBerd values with metadata."""
+    __slots__ = ('value', 'deleted', 'lifetime', 'previous', 'priority')
+    
     def __init__(self, value: Any, deleted: bool = False, lifetime: Optional[float] = None):
         self.value = value
         self.deleted = deleted
         self.lifetime = lifetime  # Expiry time
-        self.history: List[Any] = [value]  # For previous/next/current
+        self.previous = value  # Value before the last set_value, for previous
+        self.priority: Optional[int] = None  # Only set by variable declarations
         
     def is_expired(self) -> bool:
         return self.lifetime is not None and time.time() > self.lifetime
     
     def set_value(self, new_value: Any):
-        self.history.append(new_value)
+        self.previous = self.value
         self.value = new_value
     
     def get_previous(self) -> Any:
-        if len(self.history) >= 2:
-            return self.history[-2]
-        return self.value
+        return self.previous
     
     def get_current(self) -> Any:
         return self.value
@@ -37,6 +102,8 @@ class DreamBerdValue:
 
 class Maybe:
     """Represents the 'maybe' boolean value."""
+    __slots__ = ()
+    
     def __str__(self):
         return "maybe"
     
@@ -49,8 +116,39 @@ class DreamBerdError(Exception):
     pass
 
 
+class DateObject:
+    """The built-in Date, with a JavaScript-style now()."""
+    __slots__ = ()
+    
+    @staticmethod
+    def now():
+        return time.time() * 1000  # JavaScript-style timestamp
+
+
+# Built-in values shared by every interpreter; each one still gets its own
+# DreamBerdValue wrappers, so reassigning a name never leaks between runs
+_DATE = DateObject()
+_NUMBER_NAMES = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4,
+    'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9,
+    'ten': 10, 'eleven': 11, 'twelve': 12
+}
+
+
+@lru_cache(maxsize=None)
+def _visitor_names(interpreter_class: type) -> List[Tuple[type, str]]:
+    """(AST node class, visit_<ClassName> method name) pairs for an interpreter class."""
+    names = []
+    for name in dir(interpreter_class):
+        if name.startswith('visit_'):
+            node_class = getattr(dreamberd_ast, name[len('visit_'):], None)
+            if node_class is not None:
+                names.append((node_class, name))
+    return names
+
+
 class DreamBerdInterpreter:
-    def __init__(self):
+    def __init__(self, echo: bool = False):
         self.global_scope: Dict[str, DreamBerdValue] = {}
         self.scope_stack: List[Dict[str, DreamBerdValue]] = [self.global_scope]
         self.functions: Dict[str, FunctionDeclaration] = {}
@@ -59,8 +157,22 @@ class DreamBerdInterpreter:
         self.deleted_values: set = set()
         self.reversed = False
         self.output: List[str] = []
+        self.echo = echo  # Also write each output line to stdout as it is produced
         self.immutable_globals: set = set()  # Track globally immutable variables
         
+        # name -> variable found by the last scope-chain walk; cleared whenever
+        # a scope is pushed/popped or a variable is created
+        self._lookup_cache: Dict[str, DreamBerdValue] = {}
+        
+        # Emptied scope dicts from pop_scope, reused by push_scope()
+        self._scope_pool: List[Dict[str, DreamBerdValue]] = []
+        
+        # AST node class -> bound visit_<ClassName> method, so visit() needs
+        # no name formatting or attribute lookup per node
+        self._visitors: Dict[type, Callable[[ASTNode], Any]] = {
+            node_class: getattr(self, name) for node_class, name in _visitor_names(type(self))
+        }
+        
         # Initialize built-in functions
         self._init_builtins()
     
@@ -68,30 +180,23 @@ class DreamBerdInterpreter:
         """Initialize built-in functions and values."""
         # Built-in print function
         def builtin_print(*args):
-            output = ' '.join(str(arg) for arg in args)
-            self.output.append(output)
-            print(output)
+            self.emit(' '.join(str(arg) for arg in args))
         
         self.global_scope['print'] = DreamBerdValue(builtin_print)
         
         # Date object with now() method
-        class DateObject:
-            @staticmethod
-            def now():
-                return time.time() * 1000  # JavaScript-style timestamp
-        
-        self.global_scope['Date'] = DreamBerdValue(DateObject())
+        self.global_scope['Date'] = DreamBerdValue(_DATE)
         
         # Number names
-        number_names = {
-            'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4,
-            'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9,
-            'ten': 10, 'eleven': 11, 'twelve': 12
-        }
-        
-        for name, value in number_names.items():
+        for name, value in _NUMBER_NAMES.items():
             self.global_scope[name] = DreamBerdValue(value)
     
+    def emit(self, line: str):
+        """Record a line of program output, writing it through when echoing."""
+        self.output.append(line)
+        if self.echo:
+            sys.stdout.write(line + '\n')
+    
     def current_scope(self) -> Dict[str, DreamBerdValue]:
         """Get the current scope."""
         return self.scope_stack[-1]
@@ -99,27 +204,41 @@ class DreamBerdInterpreter:
     def push_scope(self, scope: Optional[Dict[str, DreamBerdValue]] = None):
         """Push a new scope onto the scope stack."""
         if scope is None:
-            scope = {}
+            scope = self._scope_pool.pop() if self._scope_pool else {}
         self.scope_stack.append(scope)
+        self._lookup_cache.clear()
     
     def pop_scope(self):
         """Pop the current scope from the scope stack."""
         if len(self.scope_stack) > 1:
-            self.scope_stack.pop()
+            scope = self.scope_stack.pop()
+            scope.clear()
+            self._scope_pool.append(scope)
+            self._lookup_cache.clear()
     
     def get_variable(self, name: str) -> DreamBerdValue:
         """Get a variable from the scope chain."""
+        # Most variables have no lifetime, so only those that do pay for the
+        # clock read in is_expired()
+        var = self._lookup_cache.get(name)
+        if var is not None and (var.lifetime is None or not var.is_expired()):
+            if var.deleted:
+                raise DreamBerdError(f"Variable '{name}' has been deleted")
+            return var
+        
         # Check for expired variables
         for scope in reversed(self.scope_stack):
-            if name in scope:
-                var = scope[name]
-                if var.is_expired():
+            var = scope.get(name)
+            if var is not None:
+                if var.lifetime is not None and var.is_expired():
                     del scope[name]
                     continue
+                self._lookup_cache[name] = var
                 if var.deleted:
                     raise DreamBerdError(f"Variable '{name}' has been deleted")
                 return var
         
+        self._lookup_cache.pop(name, None)
         raise DreamBerdError(f"Undefined variable: {name}")
     
     def set_variable(self, name: str, value: DreamBerdValue, create_new: bool = False):
@@ -127,9 +246,14 @@ class DreamBerdInterpreter:
         # For new variables or global assignment
         if create_new:
             self.current_scope()[name] = value
+            self._lookup_cache.clear()
             return
         
         # Update existing variable
+        var = self._lookup_cache.get(name)
+        if var is not None:
+            var.set_value(value.value)
+            return
         for scope in reversed(self.scope_stack):
             if name in scope:
                 scope[name].set_value(value.value)
@@ -137,43 +261,23 @@ class DreamBerdInterpreter:
         
         # If not found, create in current scope
         self.current_scope()[name] = value
+        self._lookup_cache.clear()
     
     def parse_lifetime(self, lifetime_str: str) -> Optional[float]:
         """Parse lifetime string and return expiry timestamp."""
         if not lifetime_str:
             return None
         
-        if lifetime_str.lower() == 'infinity':
+        seconds = _lifetime_seconds(lifetime_str)
+        if seconds is None:
             return None  # Never expires
-        
-        # Parse negative lifetimes (variable hoisting)
-        if lifetime_str.startswith('-'):
-            # For negative lifetimes, the variable should disappear after creation
-            # This is a special case we'll handle differently
-            return time.time() + abs(int(lifetime_str))
-        
-        # Parse time-based lifetimes
-        if lifetime_str.endswith('s'):
-            seconds = float(lifetime_str[:-1])
-            return time.time() + seconds
-        elif lifetime_str.endswith('m'):
-            minutes = float(lifetime_str[:-1])
-            return time.time() + (minutes * 60)
-        elif lifetime_str.endswith('h'):
-            hours = float(lifetime_str[:-1])
-            return time.time() + (hours * 3600)
-        else:
-            # Assume it's a number of lines (simplified: 1 second per line)
-            try:
-                lines = int(lifetime_str)
-                return time.time() + lines
-            except ValueError:
-                return None
+        return time.time() + seconds
     
-    def evaluate_arithmetic(self, left: Any, operator: str, right: Any) -> Any:
+    def evaluate_arithmetic(self, left: Any, op: str, right: Any) -> Any:
         """Evaluate arithmetic operations with DreamBerd semantics."""
-        # Handle deleted values
-        if left in self.deleted_values or right in self.deleted_values:
+        # Handle deleted values; usually none are, so skip the hashing
+        deleted_values = self.deleted_values
+        if deleted_values and (left in deleted_values or right in deleted_values):
             raise DreamBerdError("Cannot perform arithmetic on deleted values")
         
         # Handle fractions
@@ -186,60 +290,35 @@ class DreamBerdInterpreter:
             right = float(parts[0]) / float(parts[1])
         
         # Division by zero returns undefined
-        if operator == '/' and right == 0:
+        if op == '/' and right == 0:
             return "undefined"
         
         # Arithmetic operations
-        if operator == '+':
-            return left + right
-        elif operator == '-':
-            return left - right
-        elif operator == '*':
-            return left * right
-        elif operator == '/':
-            return left / right
-        elif operator == '^':
-            return left ** right
-        elif operator == '%':
-            return left % right
-        
-        return None
+        apply = _ARITHMETIC_OPERATORS.get(op)
+        if apply is None:
+            return None
+        return apply(left, right)
     
-    def evaluate_comparison(self, left: Any, operator: str, right: Any) -> bool:
+    def evaluate_comparison(self, left: Any, op: str, right: Any) -> bool:
         """Evaluate comparison operations with DreamBerd equality levels."""
-        if operator == '=':  # Very loose equality
-            return abs(left - right) < 0.5  # Close enough
-        elif operator == '==':  # Loose equality
-            return str(left) == str(right)
-        elif operator == '===':  # Strict equality
-            return left == right and type(left) == type(right)
-        elif operator == '====':  # Super strict equality (reference equality)
-            return left is right
-        elif operator == '!=':
-            return left != right
-        elif operator == '<':
-            return left < right
-        elif operator == '>':
-            return left > right
-        elif operator == '<=':
-            return left <= right
-        elif operator == '>=':
-            return left >= right
-        
-        return False
-    
-    def interpret(self, source: str):
+        apply = _COMPARISON_OPERATORS.get(op)
+        if apply is None:
+            return False
+        return apply(left, right)
+    
+    def interpret(self, source: str, cache_tokens: bool = False):
         """Interpret DreamBerd source code."""
         try:
-            ast = parse_dreamberd(source)
+            ast = parse_dreamberd(source, cache_tokens)
             return self.visit(ast)
         except Exception as e:
             raise DreamBerdError(f"Interpretation error: {e}")
     
     def visit(self, node: ASTNode) -> Any:
         """Visit an AST node and evaluate it."""
-        method_name = f'visit_{type(node).__name__}'
-        visitor = getattr(self, method_name, self.generic_visit)
+        visitor = self._visitors.get(type(node))
+        if visitor is None:
+            return self.generic_visit(node)
         return visitor(node)
     
     def generic_visit(self, node: ASTNode) -> Any:
@@ -255,15 +334,17 @@ class DreamBerdInterpreter:
         if self.reversed:
             statements = reversed(statements)
         
+        visit = self.visit
         for stmt in statements:
-            result = self.visit(stmt)
+            result = visit(stmt)
         
         return result
     
     def visit_NumberLiteral(self, node: NumberLiteral) -> Any:
         """Visit number literal."""
+        # Fractions are evaluated by the parser; only ones it couldn't
+        # evaluate (such as a zero denominator) are still text
         if isinstance(node.value, str) and '/' in node.value:
-            # Handle fractions
             parts = node.value.split('/')
             return float(parts[0]) / float(parts[1])
         
@@ -291,12 +372,16 @@ class DreamBerdInterpreter:
     
     def visit_Identifier(self, node: Identifier) -> Any:
         """Visit identifier."""
+        # Inline get_variable's cache hit for the common plain variable
+        var = self._lookup_cache.get(node.name)
+        if var is not None and var.lifetime is None and not var.deleted:
+            return var.value
         var = self.get_variable(node.name)
         return var.value
     
     def visit_ArrayLiteral(self, node: ArrayLiteral) -> List[Any]:
         """Visit array literal."""
-        return [self.visit(element) for element in node.elements]
+        return list(map(self.visit, node.elements))
     
     def visit_ArrayAccess(self, node: ArrayAccess) -> Any:
         """Visit array access with DreamBerd indexing (starts at -1)."""
@@ -323,19 +408,32 @@ class DreamBerdInterpreter:
         """Visit binary operation."""
         left = self.visit(node.left)
         right = self.visit(node.right)
-        
-        # Logical operations
-        if node.operator == '&&':
-            return left and right
-        elif node.operator == '||':
-            return left or right
-        
-        # Comparison operations
-        if node.operator in ('=', '==', '===', '====', '!=', '<', '>', '<=', '>='):
-            return self.evaluate_comparison(left, node.operator, right)
+        # Same as evaluate_binary, inlined for the common two-operand case
+        apply = _DIRECT_OPERATORS.get(node.operator)
+        if apply is not None:
+            return apply(left, right)
+        return self.evaluate_arithmetic(left, node.operator, right)
+    
+    def visit_NAryOperation(self, node: NAryOperation) -> Any:
+        """Visit same-operator chain, folding left to right like nested binary operations."""
+        visit = self.visit
+        evaluate_binary = self.evaluate_binary
+        op = node.operator
+        operands = iter(node.operands)
+        result = visit(next(operands))
+        for operand in operands:
+            result = evaluate_binary(result, op, visit(operand))
+        return result
+    
+    def evaluate_binary(self, left: Any, op: str, right: Any) -> Any:
+        """Apply a binary operator to evaluated operands."""
+        # Logical and comparison operations
+        apply = _DIRECT_OPERATORS.get(op)
+        if apply is not None:
+            return apply(left, right)
         
         # Arithmetic operations
-        return self.evaluate_arithmetic(left, node.operator, right)
+        return self.evaluate_arithmetic(left, op, right)
     
     def visit_UnaryOperation(self, node: UnaryOperation) -> Any:
         """Visit unary operation."""
@@ -354,11 +452,11 @@ class DreamBerdInterpreter:
         """Visit assignment."""
         value = self.visit(node.value)
         
-        if isinstance(node.target, Identifier):
+        if type(node.target) is Identifier:
             var = DreamBerdValue(value)
             self.set_variable(node.target.name, var)
             return value
-        elif isinstance(node.target, ArrayAccess):
+        elif type(node.target) is ArrayAccess:
             # Array element assignment with float indexing
             array = self.visit(node.target.array)
             index = self.visit(node.target.index)
@@ -380,7 +478,7 @@ class DreamBerdInterpreter:
     
     def visit_FunctionCall(self, node: FunctionCall) -> Any:
         """Visit function call."""
-        if isinstance(node.function, Identifier):
+        if type(node.function) is Identifier:
             func_name = node.function.name
             
             # Get function
@@ -390,28 +488,31 @@ class DreamBerdInterpreter:
             except DreamBerdError:
                 raise DreamBerdError(f"Undefined function: {func_name}")
             
+            # Call user-defined function; it evaluates the arguments itself
+            if type(func) is FunctionDeclaration:
+                return self.call_function(func, node.arguments)
+            
             # Evaluate arguments
-            args = [self.visit(arg) for arg in node.arguments]
+            args = list(map(self.visit, node.arguments))
             
             # Call built-in function
             if callable(func):
                 return func(*args)
-            
-            # Call user-defined function
-            if isinstance(func, FunctionDeclaration):
-                return self.call_function(func, args)
         
         raise DreamBerdError("Invalid function call")
     
-    def call_function(self, func_decl: FunctionDeclaration, args: List[Any]) -> Any:
-        """Call a user-defined function."""
-        # Create new scope for function
-        func_scope = {}
-        
-        # Bind parameters
-        for i, param in enumerate(func_decl.parameters):
-            if i < len(args):
-                func_scope[param] = DreamBerdValue(args[i])
+    def call_function(self, func_decl: FunctionDeclaration, arguments: List[Expression]) -> Any:
+        """Call a user-defined function with unevaluated argument expressions."""
+        # Evaluate arguments straight into the new function scope, which is
+        # pushed only afterwards so they still see the caller's variables
+        func_scope = self._scope_pool.pop() if self._scope_pool else {}
+        parameters = func_decl.parameters
+        visit = self.visit
+        for i, arg in enumerate(arguments):
+            value = visit(arg)
+            # Bind parameters
+            if i < len(parameters):
+                func_scope[parameters[i]] = DreamBerdValue(value)
         
         self.push_scope(func_scope)
         
@@ -420,13 +521,13 @@ class DreamBerdInterpreter:
                 # Block body
                 result = None
                 for stmt in func_decl.body:
-                    result = self.visit(stmt)
-                    if isinstance(stmt, ReturnStatement):
+                    result = visit(stmt)
+                    if type(stmt) is ReturnStatement:
                         break
                 return result
             else:
                 # Expression body
-                return self.visit(func_decl.body)
+                return visit(func_decl.body)
         finally:
             self.pop_scope()
     
@@ -452,7 +553,7 @@ class DreamBerdInterpreter:
             pass
         
         # Check if this declaration has higher priority
-        if existing_var and hasattr(existing_var, 'priority'):
+        if existing_var and existing_var.priority is not None:
             if node.priority <= existing_var.priority:
                 return  # Don't overwrite higher priority variable
         
@@ -488,13 +589,9 @@ class DreamBerdInterpreter:
         
         if node.is_debug:
             # Debug print with line info
-            debug_info = f"DEBUG: {value} (type: {type(value).__name__})"
-            self.output.append(debug_info)
-            print(debug_info)
+            self.emit(f"DEBUG: {value} (type: {type(value).__name__})")
         else:
-            output = str(value)
-            self.output.append(output)
-            print(output)
+            self.emit(str(value))
     
     def visit_ExpressionStatement(self, node: ExpressionStatement) -> Any:
         """Visit expression statement."""
@@ -502,9 +599,7 @@ class DreamBerdInterpreter:
         
         if node.is_debug:
             # Print debug info
-            debug_info = f"DEBUG: {result} (type: {type(result).__name__})"
-            self.output.append(debug_info)
-            print(debug_info)
+            self.emit(f"DEBUG: {result} (type: {type(result).__name__})")
         
         return result
     
@@ -516,7 +611,7 @@ class DreamBerdInterpreter:
     
     def visit_DeleteStatement(self, node: DeleteStatement) -> None:
         """Visit delete statement."""
-        if isinstance(node.target, Identifier):
+        if type(node.target) is Identifier:
             # Delete variable
             var_name = node.target.name
             try:
@@ -524,7 +619,7 @@ class DreamBerdInterpreter:
                 var.deleted = True
             except DreamBerdError:
                 pass
-        elif isinstance(node.target, NumberLiteral):
+        elif type(node.target) is NumberLiteral:
             # Delete number
             value = self.visit(node.target)
             self.deleted_values.add(value)
@@ -535,7 +630,7 @@ class DreamBerdInterpreter:
     
     def visit_PreviousExpression(self, node: PreviousExpression) -> Any:
         """Visit previous expression."""
-        if isinstance(node.target, Identifier):
+        if type(node.target) is Identifier:
             var = self.get_variable(node.target.name)
             return var.get_previous()
         
@@ -579,12 +674,13 @@ class DreamBerdInterpreter:
         instance = {}
         
         # Execute class body in instance context
-        instance_scope = {}
-        self.push_scope(instance_scope)
+        self.push_scope()
+        instance_scope = self.current_scope()
         
         try:
+            visit = self.visit
             for stmt in class_decl.body:
-                self.visit(stmt)
+                visit(stmt)
             
             # Copy instance variables
             for name, var in instance_scope.items():
@@ -600,13 +696,13 @@ class DreamBerdInterpreter:
     def visit_FileBlock(self, node: FileBlock) -> Any:
         """Visit file block."""
         # Create new scope for file
-        file_scope = {}
-        self.push_scope(file_scope)
+        self.push_scope()
         
         try:
             result = None
+            visit = self.visit
             for stmt in node.body:
-                result = self.visit(stmt)
+                result = visit(stmt)
             return result
         finally:
             self.pop_scope()
@@ -624,10 +720,11 @@ class DreamBerdInterpreter:
         # Also make accessible normally but mark as immutable
         self.global_scope[node.name] = wrapped_value
         self.immutable_globals.add(node.name)
+        self._lookup_cache.clear()
     
     def visit_IncrementExpression(self, node) -> Any:
         """Handle increment expressions (++x or x++)."""
-        if not isinstance(node.target, Identifier):
+        if type(node.target) is not Identifier:
             raise DreamBerdError("Can only increment variables")
         
         var_name = node.target.name
@@ -649,7 +746,7 @@ class DreamBerdInterpreter:
     
     def visit_DecrementExpression(self, node) -> Any:
         """Handle decrement expressions (--x or x--)."""
-        if not isinstance(node.target, Identifier):
+        if type(node.target) is not Identifier:
             raise DreamBerdError("Can only decrement variables")
         
         var_name = node.target.name
@@ -670,8 +767,15 @@ class DreamBerdInterpreter:
             return current_value
 
 
-def run_dreamberd(source: str) -> List[str]:
-    """Run DreamBerd source code and return output."""
-    interpreter = DreamBerdInterpreter()
-    interpreter.interpret(source)
+def run_dreamberd(source: str, cache_tokens: bool = False, echo: bool = False) -> List[str]:
+    """Run DreamBerd source code and return output.
+    
+    With cache_tokens, the token list may be reused across runs of identical
+    source when DREAMBERD_TOKEN_CACHE=1 is set (see
+    DreamBerdLexer.tokenize_cached). Output is only collected
+    unless echo is set, in which case each line is also written to stdout
+    as the program runs.
+    """
+    interpreter = DreamBerdInterpreter(echo)
+    interpreter.interpret(source, cache_tokens)
     return interpreter.output
\ No newline at end of file
@@ -3,534 +3,491 @@ DreamBerd/Gulf of Mexico Lexer
 Tokenizes DreamBerd source code into tokens for parsing.
 """
 
+import os
 import re
-from enum import Enum
+import sys
+import pickle
+import hashlib
+from enum import Enum, IntEnum, auto
+from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional, Iterator
+from typing import List, Optional
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
     # Literals
-    NUMBER = "NUMBER"
-    STRING = "STRING"
-    BOOLEAN = "BOOLEAN"
-    MAYBE = "MAYBE"
+    NUMBER = auto()
+    STRING = auto()
+    BOOLEAN = auto()
+    MAYBE = auto()
     
     # Identifiers and names
-    IDENTIFIER = "IDENTIFIER"
+    IDENTIFIER = auto()
     
     # Keywords
-    CONST = "CONST"
-    CONST_CONST_CONST = "CONST_CONST_CONST"  # const const const for global immutable data
-    VAR = "VAR"
-    FUNCTION = "FUNCTION"
-    FUNC = "FUNC"
-    FUN = "FUN"
-    FN = "FN"
-    FUNCTI = "FUNCTI"
-    F = "F"
-    UNION = "UNION"  # Also a valid function declaration
-    CLASS = "CLASS"
-    CLASSNAME = "CLASSNAME"
-    IF = "IF"
-    ELSE = "ELSE"
-    WHEN = "WHEN"
-    RETURN = "RETURN"
-    PRINT = "PRINT"
-    DELETE = "DELETE"
-    IMPORT = "IMPORT"
-    EXPORT = "EXPORT"
-    TO = "TO"
-    REVERSE = "REVERSE"
-    PREVIOUS = "PREVIOUS"
-    NEXT = "NEXT"
-    CURRENT = "CURRENT"
-    ASYNC = "ASYNC"
-    NOOP = "NOOP"
-    USE = "USE"
-    NEW = "NEW"
-    AWAIT = "AWAIT"
+    CONST = auto()
+    CONST_CONST_CONST = auto()  # const const const for global immutable data
+    VAR = auto()
+    FUNCTION = auto()
+    FUNC = auto()
+    FUN = auto()
+    FN = auto()
+    FUNCTI = auto()
+    F = auto()
+    UNION = auto()  # Also a valid function declaration
+    CLASS = auto()
+    CLASSNAME = auto()
+    IF = auto()
+    ELSE = auto()
+    WHEN = auto()
+    RETURN = auto()
+    PRINT = auto()
+    DELETE = auto()
+    IMPORT = auto()
+    EXPORT = auto()
+    TO = auto()
+    REVERSE = auto()
+    PREVIOUS = auto()
+    NEXT = auto()
+    CURRENT = auto()
+    ASYNC = auto()
+    NOOP = auto()
+    USE = auto()
+    NEW = auto()
+    AWAIT = auto()
     
     # Operators
-    PLUS = "PLUS"
-    MINUS = "MINUS"
-    MULTIPLY = "MULTIPLY"
-    DIVIDE = "DIVIDE"
-    POWER = "POWER"
-    MODULO = "MODULO"
-    INCREMENT = "INCREMENT"  # ++
-    DECREMENT = "DECREMENT"  # --
+    PLUS = auto()
+    MINUS = auto()
+    MULTIPLY = auto()
+    DIVIDE = auto()
+    POWER = auto()
+    MODULO = auto()
+    INCREMENT = auto()  # ++
+    DECREMENT = auto()  # --
     
     # Comparison operators
-    ASSIGN = "ASSIGN"           # =
-    LOOSE_EQUAL = "LOOSE_EQUAL" # ==
-    STRICT_EQUAL = "STRICT_EQUAL" # ===
-    SUPER_STRICT_EQUAL = "SUPER_STRICT_EQUAL" # ====
-    VERY_LOOSE_EQUAL = "VERY_LOOSE_EQUAL" # =
-    NOT_EQUAL = "NOT_EQUAL"     # !=
-    LESS_THAN = "LESS_THAN"
-    GREATER_THAN = "GREATER_THAN"
-    LESS_EQUAL = "LESS_EQUAL"
-    GREATER_EQUAL = "GREATER_EQUAL"
+    ASSIGN = auto()           # =
+    LOOSE_EQUAL = auto() # ==
+    STRICT_EQUAL = auto() # ===
+    SUPER_STRICT_EQUAL = auto() # ====
+    VERY_LOOSE_EQUAL = auto() # =
+    NOT_EQUAL = auto()     # !=
+    LESS_THAN = auto()
+    GREATER_THAN = auto()
+    LESS_EQUAL = auto()
+    GREATER_EQUAL = auto()
     
     # Logical operators  
-    AND = "AND"
-    OR = "OR"
-    NOT = "NOT"  # semicolon in DreamBerd
+    AND = auto()
+    OR = auto()
+    NOT = auto()  # semicolon in DreamBerd
     
     # Punctuation
-    SEMICOLON = "SEMICOLON"
-    COMMA = "COMMA"
-    DOT = "DOT"
-    COLON = "COLON"
-    ARROW = "ARROW"  # =>
+    SEMICOLON = auto()
+    COMMA = auto()
+    DOT = auto()
+    COLON = auto()
+    ARROW = auto()  # =>
     
     # Brackets
-    LPAREN = "LPAREN"
-    RPAREN = "RPAREN"
-    LBRACE = "LBRACE"
-    RBRACE = "RBRACE"
-    LBRACKET = "LBRACKET"
-    RBRACKET = "RBRACKET"
-    ANGLE_LEFT = "ANGLE_LEFT"
-    ANGLE_RIGHT = "ANGLE_RIGHT"
+    LPAREN = auto()
+    RPAREN = auto()
+    LBRACE = auto()
+    RBRACE = auto()
+    LBRACKET = auto()
+    RBRACKET = auto()
+    ANGLE_LEFT = auto()
+    ANGLE_RIGHT = auto()
     
     # Exclamation marks and priority
-    EXCLAMATION = "EXCLAMATION"
-    INVERTED_EXCLAMATION = "INVERTED_EXCLAMATION"  # ¡
-    QUESTION = "QUESTION"
+    EXCLAMATION = auto()
+    INVERTED_EXCLAMATION = auto()  # ¡
+    QUESTION = auto()
     
     # Special
-    NEWLINE = "NEWLINE"
-    INDENT = "INDENT"
-    DEDENT = "DEDENT"
-    EOF = "EOF"
+    NEWLINE = auto()  # Not emitted; newlines are dropped by the lexer
+    INDENT = auto()
+    DEDENT = auto()
+    EOF = auto()
     
     # String interpolation
-    DOLLAR = "DOLLAR"
-    POUND = "POUND"
-    YEN = "YEN"
-    EURO = "EURO"
+    DOLLAR = auto()
+    POUND = auto()
+    YEN = auto()
+    EURO = auto()
     
     # File structure
-    FILE_SEPARATOR = "FILE_SEPARATOR"  # ======
+    FILE_SEPARATOR = auto()  # ======
+    
+    # Integer members compare as plain ints; keep Enum's "TokenType.NAME"
+    # text for error messages and debug output
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     type: TokenType
     value: str
     line: int
     column: int
     priority: int = 0  # For exclamation mark priority
+    subtype: int = 0  # For NUMBER tokens: NUMBER_INT, NUMBER_FLOAT or NUMBER_TEXT
+    end_line: int = 0  # Line a multi-line string ends on; 0 means it ends on line
+
+
+# NUMBER token subtypes, so the parser converts the text without re-scanning it
+NUMBER_INT = 0
+NUMBER_FLOAT = 1
+NUMBER_TEXT = 2  # Fractions and malformed numbers such as 1.2.3 stay strings
+
+
+# Master scanner: each alternative classifies the token starting at the
+# current position. Numbers, strings and words only match their first
+# character here; the dedicated read_* methods consume the rest.
+_TOKEN_RE = re.compile(r"""
+    (?P<WS>[ \t]+)
+  | (?P<NEWLINE>\n)
+  | (?P<COMMENT>//[^\n]*)
+  | (?P<NUMBER>\d)
+  | (?P<STRING>["'])
+  | (?P<WORD>[^\W\d_])
+  | (?P<SYMBOL>=>|\+\+|--|<=|>=|[-+*/^%<>,.:(){}\[\]?;¡$£¥€])
+  | (?P<EQUALS>=+)
+  | (?P<BANG>!+)
+  | (?P<UNKNOWN>.)
+""", re.VERBOSE)
+
+# Identifier body: letters, digits, '_', '$' and the emoji pieces of 👍🎯1️⃣..0️⃣
+_IDENTIFIER_RE = re.compile('[\\w$\U0001F44D\U0001F3AF\uFE0F\u20E3]*')
+
+# Digits and dots with an optional /denominator; the groups tell an int
+# (no dot) from a float (one dot) from anything else
+_NUMBER_RE = re.compile(r'\d*(?P<dot>\.\d*)?(?P<extra>[\d.]*)(?P<denominator>/\d+)?')
+_LETTERS_RE = re.compile(r'[^\W\d_]+')
+
+_NUMBER_NAMES = {
+    'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4',
+    'five': '5', 'six': '6', 'seven': '7', 'eight': '8', 'nine': '9',
+    'ten': '10', 'eleven': '11', 'twelve': '12'
+}
+
+# "const const const": three case-insensitive consts on one line. The last one
+# must not be followed by a letter (str.isalpha, checked by read_identifier;
+# no regex class matches exactly the letters, since \w also takes numerics
+# like 'Ⅷ' and '½')
+_CONST_CONST_CONST_RE = re.compile(r'(?ai:const)[ \t]+(?ai:const)[ \t]+(?ai:const)')
+
+_SYMBOLS = {
+    '=>': TokenType.ARROW,
+    '++': TokenType.INCREMENT,
+    '--': TokenType.DECREMENT,
+    '<=': TokenType.LESS_EQUAL,
+    '>=': TokenType.GREATER_EQUAL,
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MULTIPLY,
+    '/': TokenType.DIVIDE,
+    '^': TokenType.POWER,
+    '%': TokenType.MODULO,
+    '<': TokenType.LESS_THAN,
+    '>': TokenType.GREATER_THAN,
+    ',': TokenType.COMMA,
+    '.': TokenType.DOT,
+    ':': TokenType.COLON,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    '[': TokenType.LBRACKET,
+    ']': TokenType.RBRACKET,
+    '?': TokenType.QUESTION,
+    ';': TokenType.NOT,  # Semicolon is the NOT operator in DreamBerd
+    '¡': TokenType.INVERTED_EXCLAMATION,
+    # String interpolation currency symbols
+    '$': TokenType.DOLLAR,
+    '£': TokenType.POUND,
+    '¥': TokenType.YEN,
+    '€': TokenType.EURO,
+}
+
+_EQUALS_LEVELS = {
+    1: TokenType.ASSIGN,
+    2: TokenType.LOOSE_EQUAL,
+    3: TokenType.STRICT_EQUAL,
+    4: TokenType.SUPER_STRICT_EQUAL,
+}
+
+# On-disk token cache used by DreamBerdLexer.tokenize_cached; only the most
+# recently written entries are kept
+TOKEN_CACHE_DIR = Path.home() / '.cache' / 'dreamberd' / 'tokens'
+TOKEN_CACHE_MAX_ENTRIES = 64
+_lexer_fingerprint: Optional[bytes] = None
+
+
+def _prune_token_cache() -> None:
+    """Delete the oldest cache entries beyond TOKEN_CACHE_MAX_ENTRIES."""
+    entries = []
+    with os.scandir(TOKEN_CACHE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith('.pkl'):
+                entries.append((entry.stat().st_mtime, entry.path))
+    if len(entries) > TOKEN_CACHE_MAX_ENTRIES:
+        entries.sort()
+        for _, path in entries[:-TOKEN_CACHE_MAX_ENTRIES]:
+            os.unlink(path)
+
+
+def _cache_key(source: str) -> str:
+    """Hash the source together with this module, so lexer changes invalidate old entries."""
+    global _lexer_fingerprint
+    if _lexer_fingerprint is None:
+        _lexer_fingerprint = hashlib.sha256(Path(__file__).read_bytes()).digest()
+    return hashlib.sha256(_lexer_fingerprint + source.encode('utf-8', 'surrogatepass')).hexdigest()
 
 
 class DreamBerdLexer:
+    # Keywords mapping, shared by every lexer instance
+    KEYWORDS = {
+        'const': TokenType.CONST,
+        'var': TokenType.VAR,
+        'function': TokenType.FUNCTION,
+        'func': TokenType.FUNC,
+        'fun': TokenType.FUN,
+        'fn': TokenType.FN,
+        'functi': TokenType.FUNCTI,
+        'f': TokenType.F,
+        'union': TokenType.UNION,
+        'class': TokenType.CLASS,
+        'className': TokenType.CLASSNAME,
+        'if': TokenType.IF,
+        'else': TokenType.ELSE,
+        'when': TokenType.WHEN,
+        'return': TokenType.RETURN,
+        'print': TokenType.PRINT,
+        'delete': TokenType.DELETE,
+        'import': TokenType.IMPORT,
+        'export': TokenType.EXPORT,
+        'to': TokenType.TO,
+        'reverse': TokenType.REVERSE,
+        'previous': TokenType.PREVIOUS,
+        'next': TokenType.NEXT,
+        'current': TokenType.CURRENT,
+        'async': TokenType.ASYNC,
+        'noop': TokenType.NOOP,
+        'use': TokenType.USE,
+        'new': TokenType.NEW,
+        'await': TokenType.AWAIT,
+        'true': TokenType.BOOLEAN,
+        'false': TokenType.BOOLEAN,
+        'maybe': TokenType.MAYBE,
+        'True': TokenType.BOOLEAN,
+        'False': TokenType.BOOLEAN,
+        'undefined': TokenType.IDENTIFIER,  # Special value
+        'null': TokenType.IDENTIFIER,      # Special value
+    }
+    
     def __init__(self, source: str):
         self.source = source
         self.pos = 0
         self.line = 1
-        self.column = 1
+        self.line_start = 0  # Offset of the first character of the current line
         self.tokens: List[Token] = []
-        
-        # Keywords mapping
-        self.keywords = {
-            'const': TokenType.CONST,
-            'var': TokenType.VAR,
-            'function': TokenType.FUNCTION,
-            'func': TokenType.FUNC,
-            'fun': TokenType.FUN,
-            'fn': TokenType.FN,
-            'functi': TokenType.FUNCTI,
-            'f': TokenType.F,
-            'union': TokenType.UNION,
-            'class': TokenType.CLASS,
-            'className': TokenType.CLASSNAME,
-            'if': TokenType.IF,
-            'else': TokenType.ELSE,
-            'when': TokenType.WHEN,
-            'return': TokenType.RETURN,
-            'print': TokenType.PRINT,
-            'delete': TokenType.DELETE,
-            'import': TokenType.IMPORT,
-            'export': TokenType.EXPORT,
-            'to': TokenType.TO,
-            'reverse': TokenType.REVERSE,
-            'previous': TokenType.PREVIOUS,
-            'next': TokenType.NEXT,
-            'current': TokenType.CURRENT,
-            'async': TokenType.ASYNC,
-            'noop': TokenType.NOOP,
-            'use': TokenType.USE,
-            'new': TokenType.NEW,
-            'await': TokenType.AWAIT,
-            'true': TokenType.BOOLEAN,
-            'false': TokenType.BOOLEAN,
-            'maybe': TokenType.MAYBE,
-            'True': TokenType.BOOLEAN,
-            'False': TokenType.BOOLEAN,
-            'undefined': TokenType.IDENTIFIER,  # Special value
-            'null': TokenType.IDENTIFIER,      # Special value
-        }
-        
-    def current_char(self) -> Optional[str]:
-        if self.pos >= len(self.source):
-            return None
-        return self.source[self.pos]
     
-    def peek_char(self, offset: int = 1) -> Optional[str]:
-        pos = self.pos + offset
-        if pos >= len(self.source):
-            return None
-        return self.source[pos]
+    def reset(self, source: str):
+        """Rewind the lexer onto new source."""
+        self.source = source
+        self.pos = 0
+        self.line = 1
+        self.line_start = 0
+        self.tokens = []  # Fresh list; earlier results may still be in use
     
-    def advance(self):
-        if self.pos < len(self.source) and self.source[self.pos] == '\n':
-            self.line += 1
-            self.column = 1
+    @classmethod
+    def tokenize_cached(cls, source: str) -> List[Token]:
+        """Tokenize source, reusing the token list pickled by an earlier run.
+        
+        The cache is opt-in: it is only used when DREAMBERD_TOKEN_CACHE=1 is
+        set, and holds at most TOKEN_CACHE_MAX_ENTRIES entries.
+        """
+        if os.environ.get('DREAMBERD_TOKEN_CACHE') != '1':
+            return cls(source).tokenize()
+        
+        cache_file = TOKEN_CACHE_DIR / f'{_cache_key(source)}.pkl'
+        try:
+            with open(cache_file, 'rb') as f:
+                tokens = pickle.load(f)
+        except FileNotFoundError:
+            pass  # Not cached yet
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            # Corrupt or stale entry; drop it so it isn't read again
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
         else:
-            self.column += 1
-        self.pos += 1
+            # Unpickled strings are new objects; intern them again so token
+            # spellings stay identical to the interpreter's keys
+            intern = sys.intern
+            for token in tokens:
+                token.value = intern(token.value)
+            return tokens
+        
+        tokens = cls(source).tokenize()
+        try:
+            TOKEN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(temp_file, 'wb') as f:
+                pickle.dump(tokens, f, protocol=5)
+            os.replace(temp_file, cache_file)
+            _prune_token_cache()
+        except OSError:
+            pass  # Caching is best-effort
+        return tokens
     
-    def skip_whitespace(self):
-        while self.current_char() and self.current_char() in ' \t':
-            self.advance()
+    @property
+    def column(self) -> int:
+        return self.pos - self.line_start + 1
     
     def read_number(self) -> Token:
         start_line, start_column = self.line, self.column
-        value = ""
         
         # Handle number names like "one", "two", etc.
-        number_names = {
-            'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4',
-            'five': '5', 'six': '6', 'seven': '7', 'eight': '8', 'nine': '9',
-            'ten': '10', 'eleven': '11', 'twelve': '12'
-        }
-        
-        # Check if this might be a word number
-        word = ""
-        temp_pos = self.pos
-        while temp_pos < len(self.source) and self.source[temp_pos].isalpha():
-            word += self.source[temp_pos]
-            temp_pos += 1
-        
-        if word.lower() in number_names:
-            value = number_names[word.lower()]
-            while self.current_char() and self.current_char().isalpha():
-                self.advance()
-            return Token(TokenType.NUMBER, value, start_line, start_column)
+        if self.source[self.pos].isalpha():
+            match = _LETTERS_RE.match(self.source, self.pos)
+            value = _NUMBER_NAMES.get(match.group().lower())
+            if value is not None:
+                self.pos = match.end()
+                return Token(TokenType.NUMBER, value, start_line, start_column)
         
-        # Regular number parsing
-        while self.current_char() and (self.current_char().isdigit() or self.current_char() == '.'):
-            value += self.current_char()
-            self.advance()
+        # Digits and dots, optionally followed by a /denominator fraction
+        match = _NUMBER_RE.match(self.source, self.pos)
+        value = match.group()
+        value = sys.intern(value)
+        self.pos = match.end()
         
-        # Handle fractions
-        if self.current_char() == '/' and self.peek_char() and self.peek_char().isdigit():
-            value += self.current_char()
-            self.advance()
-            while self.current_char() and self.current_char().isdigit():
-                value += self.current_char()
-                self.advance()
-        
-        return Token(TokenType.NUMBER, value, start_line, start_column)
+        if match.group('denominator') or match.group('extra'):
+            subtype = NUMBER_TEXT
+        elif match.group('dot'):
+            subtype = NUMBER_FLOAT
+        else:
+            subtype = NUMBER_INT
+        return Token(TokenType.NUMBER, value, start_line, start_column, 0, subtype)
     
     def read_string(self, quote_char: str) -> Token:
         start_line, start_column = self.line, self.column
-        value = ""
-        quote_count = 1
+        source = self.source
+        start_pos = self.pos
         
-        # Count consecutive quotes
-        self.advance()  # Skip first quote
-        while self.current_char() == quote_char:
-            quote_count += 1
-            self.advance()
+        # Count consecutive quotes; the string closes at the next run of
+        # at least as many quotes (or runs to the end of the source)
+        value_start = start_pos + 1
+        while value_start < len(source) and source[value_start] == quote_char:
+            value_start += 1
+        closing = quote_char * (value_start - start_pos)
         
-        # Handle bare strings (no quotes - this is actually for identifiers)
-        if quote_count == 1:
-            # This is just a single quote, continue with regular string parsing
-            pass
+        value_end = source.find(closing, value_start)
+        if value_end == -1:
+            value_end = end = len(source)
+        else:
+            end = value_end + len(closing)
+        value = source[value_start:value_end]
         
-        # Regular string with quotes
-        while self.current_char():
-            if self.current_char() == quote_char:
-                # Check if we have enough closing quotes
-                closing_quotes = 0
-                temp_pos = self.pos
-                while (temp_pos < len(self.source) and 
-                       self.source[temp_pos] == quote_char):
-                    closing_quotes += 1
-                    temp_pos += 1
-                
-                if closing_quotes >= quote_count:
-                    # Skip the closing quotes
-                    for _ in range(quote_count):
-                        self.advance()
-                    break
-                else:
-                    value += self.current_char()
-                    self.advance()
-            else:
-                value += self.current_char()
-                self.advance()
+        # Strings may span lines
+        self.pos = end
+        newlines = value.count('\n')
+        if newlines:
+            self.line += newlines
+            self.line_start = source.rfind('\n', start_pos, end) + 1
         
-        return Token(TokenType.STRING, value, start_line, start_column)
+        return Token(TokenType.STRING, value, start_line, start_column,
+                     end_line=self.line if newlines else 0)
     
     def read_identifier(self) -> Token:
         start_line, start_column = self.line, self.column
-        value = ""
+        start_pos = self.pos
         
         # DreamBerd allows any Unicode character as identifier
-        while (self.current_char() and 
-               (self.current_char().isalnum() or 
-                self.current_char() in '_$👍🎯1️⃣2️⃣3️⃣4️⃣5️⃣6️⃣7️⃣8️⃣9️⃣0️⃣')):
-            value += self.current_char()
-            self.advance()
+        match = _IDENTIFIER_RE.match(self.source, start_pos)
+        value = match.group()
+        value = sys.intern(value)
+        self.pos = match.end()
+        
+        # Keywords are case-insensitive; most source is already lowercase,
+        # so only fold case when needed
+        key = value if value.islower() else value.lower()
         
         # Special handling for "const const const"
-        if value.lower() == 'const':
-            # Check if followed by another "const"
-            saved_pos = self.pos
-            saved_line = self.line
-            saved_column = self.column
-            
-            # Skip whitespace
-            while self.current_char() and self.current_char() in ' \t':
-                self.advance()
-            
-            # Check for second "const"
-            if self.current_char() and self.current_char().isalpha():
-                next_word = ""
-                temp_pos = self.pos
-                while (temp_pos < len(self.source) and 
-                       self.source[temp_pos].isalpha()):
-                    next_word += self.source[temp_pos]
-                    temp_pos += 1
-                
-                if next_word.lower() == 'const':
-                    # Consume second "const"
-                    for _ in range(len(next_word)):
-                        self.advance()
-                    
-                    # Skip whitespace again
-                    while self.current_char() and self.current_char() in ' \t':
-                        self.advance()
-                    
-                    # Check for third "const"
-                    if self.current_char() and self.current_char().isalpha():
-                        third_word = ""
-                        temp_pos = self.pos
-                        while (temp_pos < len(self.source) and 
-                               self.source[temp_pos].isalpha()):
-                            third_word += self.source[temp_pos]
-                            temp_pos += 1
-                        
-                        if third_word.lower() == 'const':
-                            # Consume third "const"
-                            for _ in range(len(third_word)):
-                                self.advance()
-                            return Token(TokenType.CONST_CONST_CONST, 'const const const', start_line, start_column)
-            
-            # Restore position if not const const const
-            self.pos = saved_pos
-            self.line = saved_line
-            self.column = saved_column
+        if key == 'const':
+            match = _CONST_CONST_CONST_RE.match(self.source, start_pos)
+            if match and not self.source[match.end():match.end() + 1].isalpha():
+                self.pos = match.end()
+                return Token(TokenType.CONST_CONST_CONST, 'const const const', start_line, start_column)
         
         # Check if it's a keyword
-        token_type = self.keywords.get(value.lower(), TokenType.IDENTIFIER)
+        token_type = self.KEYWORDS.get(key, TokenType.IDENTIFIER)
         return Token(token_type, value, start_line, start_column)
     
-    def read_exclamation_marks(self) -> Token:
-        start_line, start_column = self.line, self.column
-        count = 0
-        
-        while self.current_char() == '!':
-            count += 1
-            self.advance()
-        
-        return Token(TokenType.EXCLAMATION, '!' * count, start_line, start_column, priority=count)
-    
     def tokenize(self) -> List[Token]:
-        while self.pos < len(self.source):
-            self.skip_whitespace()
-            
-            if not self.current_char():
-                break
-            
-            char = self.current_char()
-            start_line, start_column = self.line, self.column
-            
-            # Newlines
-            if char == '\n':
-                self.tokens.append(Token(TokenType.NEWLINE, char, start_line, start_column))
-                self.advance()
-            
-            # Comments (// style)
-            elif char == '/' and self.peek_char() == '/':
-                while self.current_char() and self.current_char() != '\n':
-                    self.advance()
-            
-            # Numbers
-            elif char.isdigit():
-                self.tokens.append(self.read_number())
-            
-            # Strings
-            elif char in '"\'':
-                self.tokens.append(self.read_string(char))
-            
-            # Identifiers and number names
-            elif char.isalpha():
-                self.tokens.append(self.read_identifier())
-            
-            # Arrow => (check before equals)
-            elif char == '=' and self.peek_char() == '>':
-                self.advance()  # =
-                self.advance()  # >
-                self.tokens.append(Token(TokenType.ARROW, '=>', start_line, start_column))
+        source = self.source
+        length = len(source)
+        match_token = _TOKEN_RE.match
+        append = self.tokens.append
+        # Identifier, number and operator spellings are interned process-wide,
+        # so they are the same objects as the interpreter's scope and operator
+        # table keys and dict lookups match on identity
+        intern = sys.intern
+        # Columns are derived from the offset of the current line start
+        pos, line, line_start = self.pos, self.line, self.line_start
+        
+        while pos < length:
+            match = match_token(source, pos)
+            kind = match.lastgroup
+            end = match.end()
             
-            # File separator (5+ equals)
-            elif char == '=':
-                equals_count = 0
-                temp_pos = self.pos
-                while temp_pos < len(self.source) and self.source[temp_pos] == '=':
-                    equals_count += 1
-                    temp_pos += 1
-                
-                if equals_count >= 5:
-                    # This is a file separator
-                    value = '=' * equals_count
-                    for _ in range(equals_count):
-                        self.advance()
-                    self.tokens.append(Token(TokenType.FILE_SEPARATOR, value, start_line, start_column))
-                elif equals_count == 4:
-                    # ====
-                    for _ in range(4):
-                        self.advance()
-                    self.tokens.append(Token(TokenType.SUPER_STRICT_EQUAL, '====', start_line, start_column))
-                elif equals_count == 3:
-                    # ===
-                    for _ in range(3):
-                        self.advance()
-                    self.tokens.append(Token(TokenType.STRICT_EQUAL, '===', start_line, start_column))
-                elif equals_count == 2:
-                    # ==
-                    for _ in range(2):
-                        self.advance()
-                    self.tokens.append(Token(TokenType.LOOSE_EQUAL, '==', start_line, start_column))
-                else:
-                    # Single =
-                    self.advance()
-                    self.tokens.append(Token(TokenType.ASSIGN, '=', start_line, start_column))
+            # Whitespace, comments and unknown characters produce no token
+            if kind == 'WS' or kind == 'COMMENT' or kind == 'UNKNOWN':
+                pass
             
-            # Exclamation marks
-            elif char == '!':
-                self.tokens.append(self.read_exclamation_marks())
+            elif kind == 'SYMBOL':
+                value = match.group()
+                value = intern(value)
+                token_type = _SYMBOLS[value]
+                priority = -1 if token_type is TokenType.INVERTED_EXCLAMATION else 0
+                append(Token(token_type, value, line, pos - line_start + 1, priority=priority))
             
-            # Inverted exclamation
-            elif char == '¡':
-                self.tokens.append(Token(TokenType.INVERTED_EXCLAMATION, char, start_line, start_column, priority=-1))
-                self.advance()
+            # Newlines only advance the line count; statements end at ! or ?
+            elif kind == 'NEWLINE':
+                line += 1
+                line_start = end
             
-            # Question mark
-            elif char == '?':
-                self.tokens.append(Token(TokenType.QUESTION, char, start_line, start_column))
-                self.advance()
+            # =, ==, === and ==== are equality levels; 5+ equals is a file separator
+            elif kind == 'EQUALS':
+                value = match.group()
+                token_type = _EQUALS_LEVELS.get(end - pos, TokenType.FILE_SEPARATOR)
+                append(Token(token_type, intern(value), line, pos - line_start + 1))
             
-            # Semicolon (NOT operator in DreamBerd)
-            elif char == ';':
-                self.tokens.append(Token(TokenType.NOT, char, start_line, start_column))
-                self.advance()
+            elif kind == 'BANG':
+                value = match.group()
+                append(Token(TokenType.EXCLAMATION, intern(value), line, pos - line_start + 1,
+                             priority=end - pos))
             
-            # Single character tokens
-            elif char == '+':
-                if self.peek_char() == '+':
-                    self.advance()  # first +
-                    self.advance()  # second +
-                    self.tokens.append(Token(TokenType.INCREMENT, '++', start_line, start_column))
-                else:
-                    self.tokens.append(Token(TokenType.PLUS, char, start_line, start_column))
-                    self.advance()
-            elif char == '-':
-                if self.peek_char() == '-':
-                    self.advance()  # first -
-                    self.advance()  # second -
-                    self.tokens.append(Token(TokenType.DECREMENT, '--', start_line, start_column))
+            # Numbers, strings and words are consumed by their readers. Numeric
+            # characters like '²' or 'Ⅷ' that aren't letters fall through and
+            # are skipped.
+            elif kind != 'WORD' or match.group().isalpha():
+                self.pos, self.line, self.line_start = pos, line, line_start
+                if kind == 'WORD':
+                    append(self.read_identifier())
+                elif kind == 'NUMBER':
+                    append(self.read_number())
                 else:
-                    self.tokens.append(Token(TokenType.MINUS, char, start_line, start_column))
-                    self.advance()
-            elif char == '*':
-                self.tokens.append(Token(TokenType.MULTIPLY, char, start_line, start_column))
-                self.advance()
-            elif char == '/':
-                self.tokens.append(Token(TokenType.DIVIDE, char, start_line, start_column))
-                self.advance()
-            elif char == '^':
-                self.tokens.append(Token(TokenType.POWER, char, start_line, start_column))
-                self.advance()
-            elif char == '%':
-                self.tokens.append(Token(TokenType.MODULO, char, start_line, start_column))
-                self.advance()
-            elif char == '<':
-                if self.peek_char() == '=':
-                    self.advance()
-                    self.advance()
-                    self.tokens.append(Token(TokenType.LESS_EQUAL, '<=', start_line, start_column))
-                else:
-                    self.tokens.append(Token(TokenType.LESS_THAN, char, start_line, start_column))
-                    self.advance()
-            elif char == '>':
-                if self.peek_char() == '=':
-                    self.advance()
-                    self.advance()
-                    self.tokens.append(Token(TokenType.GREATER_EQUAL, '>=', start_line, start_column))
-                else:
-                    self.tokens.append(Token(TokenType.GREATER_THAN, char, start_line, start_column))
-                    self.advance()
-            elif char == ',':
-                self.tokens.append(Token(TokenType.COMMA, char, start_line, start_column))
-                self.advance()
-            elif char == '.':
-                self.tokens.append(Token(TokenType.DOT, char, start_line, start_column))
-                self.advance()
-            elif char == ':':
-                self.tokens.append(Token(TokenType.COLON, char, start_line, start_column))
-                self.advance()
-            elif char == '(':
-                self.tokens.append(Token(TokenType.LPAREN, char, start_line, start_column))
-                self.advance()
-            elif char == ')':
-                self.tokens.append(Token(TokenType.RPAREN, char, start_line, start_column))
-                self.advance()
-            elif char == '{':
-                self.tokens.append(Token(TokenType.LBRACE, char, start_line, start_column))
-                self.advance()
-            elif char == '}':
-                self.tokens.append(Token(TokenType.RBRACE, char, start_line, start_column))
-                self.advance()
-            elif char == '[':
-                self.tokens.append(Token(TokenType.LBRACKET, char, start_line, start_column))
-                self.advance()
-            elif char == ']':
-                self.tokens.append(Token(TokenType.RBRACKET, char, start_line, start_column))
-                self.advance()
-            
-            # String interpolation currency symbols
-            elif char == '$':
-                self.tokens.append(Token(TokenType.DOLLAR, char, start_line, start_column))
-                self.advance()
-            elif char == '£':
-                self.tokens.append(Token(TokenType.POUND, char, start_line, start_column))
-                self.advance()
-            elif char == '¥':
-                self.tokens.append(Token(TokenType.YEN, char, start_line, start_column))
-                self.advance()
-            elif char == '€':
-                self.tokens.append(Token(TokenType.EURO, char, start_line, start_column))
-                self.advance()
+                    append(self.read_string(match.group()))
+                pos, line, line_start = self.pos, self.line, self.line_start
+                continue
             
-            else:
-                # Unknown character, skip it
-                self.advance()
+            pos = end
         
-        self.tokens.append(Token(TokenType.EOF, '', self.line, self.column))
-        return self.tokens
\ No newline at end of file
+        self.pos, self.line, self.line_start = pos, line, line_start
+        append(Token(TokenType.EOF, '', line, self.column))
+        return self.tokens
@@ -3,177 +3,307 @@ DreamBerd/Gulf of Mexico Parser
 Parses DreamBerd tokens into an Abstract Syntax Tree.
 """
 
-from typing import List, Optional, Union, Any
-from dreamberd_lexer import Token, TokenType, DreamBerdLexer
-from dreamberd_ast import *
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Union, Any
+from dreamberd_lexer import Token, TokenType, DreamBerdLexer, NUMBER_INT, NUMBER_FLOAT, NUMBER_TEXT
+from dreamberd_ast import (
+    Expression, Statement, Program, FileBlock,
+    NumberLiteral, StringLiteral, BooleanLiteral, MaybeLiteral, UndefinedLiteral, NullLiteral,
+    Identifier, ArrayLiteral, ArrayAccess, MemberAccess, FunctionCall, NewExpression,
+    BinaryOperation, NAryOperation, UnaryOperation, IncrementExpression, DecrementExpression,
+    PreviousExpression, NextExpression, CurrentExpression, AwaitExpression, UseExpression,
+    VariableDeclaration, GlobalConstantDeclaration, FunctionDeclaration, ClassDeclaration,
+    IfStatement, WhenStatement, ReturnStatement, DeleteStatement, ImportStatement, ExportStatement,
+    ReverseStatement, NoopStatement, ExpressionStatement,
+)
+
+# Token groups checked together by the parser
+_DECLARATION_KEYWORDS = frozenset({TokenType.CONST, TokenType.VAR, TokenType.CONST_CONST_CONST})
+_FUNCTION_KEYWORDS = frozenset({TokenType.FUNCTION, TokenType.FUNC, TokenType.FUN, TokenType.FN,
+                                TokenType.FUNCTI, TokenType.F, TokenType.UNION})
+_CLASS_KEYWORDS = frozenset({TokenType.CLASS, TokenType.CLASSNAME})
+_CONST_OR_VAR = frozenset({TokenType.CONST, TokenType.VAR})
+_RETURN_END = frozenset({TokenType.EXCLAMATION, TokenType.QUESTION, TokenType.EOF})
+_UNARY_OPERATORS = frozenset({TokenType.NOT, TokenType.MINUS, TokenType.PLUS})
+
+# NUMBER token subtype -> value conversion (text is kept for fractions and
+# malformed numbers, and evaluated later)
+def _fraction_or_text(text: str) -> Union[float, str]:
+    """Evaluate a fraction literal like 1/2 once, at parse time.
+    
+    Anything that doesn't evaluate (1.2.3, 1/0) stays text, for the
+    interpreter to handle as before.
+    """
+    numerator, slash, denominator = text.partition('/')
+    if slash:
+        try:
+            return float(numerator) / float(denominator)
+        except (ValueError, ZeroDivisionError):
+            pass
+    return text
+
+
+_NUMBER_CONVERTERS: Dict[int, Callable[[str], Any]] = {NUMBER_INT: int, NUMBER_FLOAT: float,
+                                                      NUMBER_TEXT: _fraction_or_text}
+
+# Shared nodes for literals that recur throughout a program. The parser never
+# hands these out for mutation and the interpreter only reads the AST, so one
+# instance can stand in for every occurrence
+_TRUE = BooleanLiteral(True)
+_FALSE = BooleanLiteral(False)
+_MAYBE = MaybeLiteral()
+_UNDEFINED = UndefinedLiteral()
+_NULL = NullLiteral()
+_PRINT = Identifier('print')
+_SMALL_INTS = {str(i): NumberLiteral(i) for i in range(64)}
+
+# Operators whose same-operator runs are collected into one NAryOperation
+_CHAIN_OPERATORS = frozenset({TokenType.PLUS, TokenType.MULTIPLY, TokenType.AND, TokenType.OR})
+
+# Token types compared once per token, bound as plain globals: attribute
+# lookups on the enum class go through EnumType.__getattr__ and are slow
+_EOF = TokenType.EOF
+_EXCLAMATION = TokenType.EXCLAMATION
+_INVERTED_EXCLAMATION = TokenType.INVERTED_EXCLAMATION
+_QUESTION = TokenType.QUESTION
+_DOT = TokenType.DOT
+_LBRACKET = TokenType.LBRACKET
+_RBRACKET = TokenType.RBRACKET
+_LPAREN = TokenType.LPAREN
+_RPAREN = TokenType.RPAREN
+_COMMA = TokenType.COMMA
+_PREVIOUS = TokenType.PREVIOUS
+_NEXT = TokenType.NEXT
+_CURRENT = TokenType.CURRENT
+_AWAIT = TokenType.AWAIT
+
+# Copies of the EOF token kept after the real one, so advance() and peek()
+# never need a bounds check
+_EOF_PADDING = 8
+
+# Binary operator precedence, loosest first; every level is left-associative
+_BINARY_PRECEDENCE: Dict[TokenType, int] = {
+    TokenType.OR: 1,
+    TokenType.AND: 2,
+    TokenType.ASSIGN: 3,
+    TokenType.LOOSE_EQUAL: 3,
+    TokenType.STRICT_EQUAL: 3,
+    TokenType.SUPER_STRICT_EQUAL: 3,
+    TokenType.VERY_LOOSE_EQUAL: 3,
+    TokenType.NOT_EQUAL: 3,
+    TokenType.LESS_THAN: 4,
+    TokenType.GREATER_THAN: 4,
+    TokenType.LESS_EQUAL: 4,
+    TokenType.GREATER_EQUAL: 4,
+    TokenType.PLUS: 5,
+    TokenType.MINUS: 5,
+    TokenType.MULTIPLY: 6,
+    TokenType.DIVIDE: 6,
+    TokenType.MODULO: 6,
+    TokenType.POWER: 7,
+}
 
 
 class ParseError(Exception):
-    def __init__(self, message: str, token: Token):
-        self.message = message
-        self.token = token
-        super().__init__(f"Parse error at line {token.line}, column {token.column}: {message}")
+    def __init__(self, message: Optional[str], token: Token, expected: Optional[TokenType] = None):
+        self.token: Token = token
+        self.expected: Optional[TokenType] = expected
+        self._message: Optional[str] = message
+        super().__init__(message, token)
+    
+    @property
+    def message(self) -> str:
+        # Only built when the error is actually reported
+        if self._message:
+            return self._message
+        return f"Expected {self.expected}, got {self.token.type}"
+    
+    def __str__(self) -> str:
+        return f"Parse error at line {self.token.line}, column {self.token.column}: {self.message}"
 
 
 class DreamBerdParser:
     def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
-        self.pos = 0
-        self.current_token = self.tokens[0] if tokens else None
-    
-    def advance(self):
-        """Move to the next token."""
-        if self.pos < len(self.tokens) - 1:
-            self.pos += 1
-            self.current_token = self.tokens[self.pos]
+        self.tokens: List[Token]
+        if tokens and tokens[-1].type == TokenType.EOF:
+            eof = tokens[-1]
+            self.tokens = list(tokens)
         else:
-            self.current_token = self.tokens[-1]  # EOF token
+            eof = Token(TokenType.EOF, "", tokens[-1].line if tokens else 1, 0)
+            self.tokens = list(tokens) + [eof]
+        self.tokens.extend([eof] * _EOF_PADDING)
+        self.pos: int = 0
+        self.current_token: Token = self.tokens[0]
+        
+        # Leading token -> statement parser; anything else is an expression statement
+        self._statement_parsers: Dict[TokenType, Callable[[], Statement]] = {
+            TokenType.ASYNC: self.parse_async_function_declaration,
+            TokenType.IF: self.parse_if_statement,
+            TokenType.WHEN: self.parse_when_statement,
+            TokenType.RETURN: self.parse_return_statement,
+            TokenType.DELETE: self.parse_delete_statement,
+            TokenType.IMPORT: self.parse_import_statement,
+            TokenType.EXPORT: self.parse_export_statement,
+            TokenType.REVERSE: self.parse_reverse_statement,
+            TokenType.STRING: self.parse_noop_statement,
+        }
+        for token_type in _DECLARATION_KEYWORDS:
+            self._statement_parsers[token_type] = self.parse_variable_declaration
+        for token_type in _FUNCTION_KEYWORDS:
+            self._statement_parsers[token_type] = self.parse_function_declaration
+        for token_type in _CLASS_KEYWORDS:
+            self._statement_parsers[token_type] = self.parse_class_declaration
+        
+        # Leading token -> primary expression parser
+        self._primary_parsers: Dict[TokenType, Callable[[], Expression]] = {
+            TokenType.NUMBER: self.parse_number_literal,
+            TokenType.STRING: self.parse_string_literal,
+            TokenType.BOOLEAN: self.parse_boolean_literal,
+            TokenType.MAYBE: self.parse_maybe_literal,
+            TokenType.IDENTIFIER: self.parse_identifier,
+            TokenType.LBRACKET: self.parse_array_literal,
+            TokenType.LPAREN: self.parse_parenthesized_expression,
+            TokenType.USE: self.parse_use_expression,
+            TokenType.NEW: self.parse_new_expression,
+            TokenType.PRINT: self.parse_print_identifier,
+            TokenType.INCREMENT: self.parse_prefix_increment,
+            TokenType.DECREMENT: self.parse_prefix_decrement,
+        }
+    
+    def advance(self) -> Token:
+        """Move to the next token and return it."""
+        # The parser never advances past EOF, so the padding keeps this in range
+        self.pos += 1
+        self.current_token = token = self.tokens[self.pos]
+        return token
     
-    def peek(self, offset: int = 1) -> Optional[Token]:
-        """Look ahead at the next token without consuming it."""
-        pos = self.pos + offset
-        if 0 <= pos < len(self.tokens):
-            return self.tokens[pos]
-        return None
+    def on_new_line(self) -> bool:
+        """Check if the current token starts on a later line than the previous token ends."""
+        previous = self.tokens[self.pos - 1]
+        return self.current_token.line != (previous.end_line or previous.line)
     
-    def match(self, *token_types: TokenType) -> bool:
-        """Check if current token matches any of the given types."""
-        return self.current_token and self.current_token.type in token_types
+    def peek(self, offset: int = 1) -> Token:
+        """Look ahead at the next token without consuming it (offset <= _EOF_PADDING)."""
+        return self.tokens[self.pos + offset]
     
-    def consume(self, token_type: TokenType, message: str = "") -> Token:
+    def match(self, token_type: TokenType) -> bool:
+        """Check if current token is of the given type."""
+        return self.current_token.type == token_type
+    
+    def match_any(self, token_types: FrozenSet[TokenType]) -> bool:
+        """Check if current token is in one of the module-level token groups."""
+        return self.current_token.type in token_types
+    
+    def consume(self, token_type: TokenType, message: Optional[str] = None) -> Token:
         """Consume a token of the expected type or raise an error."""
-        if not self.current_token or self.current_token.type != token_type:
-            error_msg = message or f"Expected {token_type}, got {self.current_token.type if self.current_token else 'EOF'}"
-            raise ParseError(error_msg, self.current_token or Token(TokenType.EOF, "", 0, 0))
-        
         token = self.current_token
+        if token.type != token_type:
+            raise ParseError(message, token, token_type)
+        
         self.advance()
         return token
     
-    def skip_newlines(self):
-        """Skip newline tokens."""
-        while self.match(TokenType.NEWLINE):
-            self.advance()
+    def parse_block(self, end_type: TokenType = TokenType.RBRACE) -> List[Statement]:
+        """Parse statements up to (not including) end_type or EOF."""
+        body = []
+        append = body.append
+        
+        while True:
+            token_type = self.current_token.type
+            if token_type == end_type or token_type == _EOF:
+                break
+            stmt = self.parse_statement()
+            if stmt is not None:
+                append(stmt)
+        
+        return body
     
     def parse(self) -> Program:
         """Parse the tokens into a Program AST node."""
         statements = []
+        append = statements.append
         
-        while not self.match(TokenType.EOF):
-            self.skip_newlines()
-            
-            if self.match(TokenType.EOF):
-                break
-                
+        while not self.match(_EOF):
             # Check for file separator
             if self.match(TokenType.FILE_SEPARATOR):
+                separator = self.current_token
                 self.advance()
-                # Look for optional file name
+                # Look for optional file name on the separator line
                 file_name = None
-                if self.match(TokenType.IDENTIFIER):
+                if self.match(TokenType.IDENTIFIER) and self.current_token.line == separator.line:
                     file_name = self.current_token.value
                     self.advance()
                 
                 # Parse file body until next separator or EOF
-                file_body = []
-                while not self.match(TokenType.FILE_SEPARATOR, TokenType.EOF):
-                    self.skip_newlines()
-                    if not self.match(TokenType.FILE_SEPARATOR, TokenType.EOF):
-                        stmt = self.parse_statement()
-                        if stmt:
-                            file_body.append(stmt)
+                file_body = self.parse_block(TokenType.FILE_SEPARATOR)
                 
-                statements.append(FileBlock(file_name, file_body))
+                append(FileBlock(file_name, file_body))
             else:
                 stmt = self.parse_statement()
-                if stmt:
-                    statements.append(stmt)
+                if stmt is not None:
+                    append(stmt)
         
         return Program(statements)
     
     def parse_statement(self) -> Optional[Statement]:
         """Parse a statement."""
-        self.skip_newlines()
-        
-        if self.match(TokenType.EOF):
+        if self.match(_EOF):
             return None
         
-        # Variable declarations (const/var combinations and const const const)
-        if self.match(TokenType.CONST, TokenType.VAR, TokenType.CONST_CONST_CONST):
-            return self.parse_variable_declaration()
-        
-        # Function declarations
-        if self.match(TokenType.FUNCTION, TokenType.FUNC, TokenType.FUN, 
-                     TokenType.FN, TokenType.FUNCTI, TokenType.F, TokenType.UNION):
-            return self.parse_function_declaration()
-        
-        # Async function declarations
-        if self.match(TokenType.ASYNC):
-            self.advance()
-            if self.match(TokenType.FUNCTION, TokenType.FUNC, TokenType.FUN, 
-                         TokenType.FN, TokenType.FUNCTI, TokenType.F, TokenType.UNION):
-                func_decl = self.parse_function_declaration()
-                func_decl.is_async = True
-                return func_decl
-        
-        # Class declarations
-        if self.match(TokenType.CLASS, TokenType.CLASSNAME):
-            return self.parse_class_declaration()
-        
-        # Control flow
-        if self.match(TokenType.IF):
-            return self.parse_if_statement()
-        
-        if self.match(TokenType.WHEN):
-            return self.parse_when_statement()
-        
-        if self.match(TokenType.RETURN):
-            return self.parse_return_statement()
-        
-        # Special statements
-        if self.match(TokenType.DELETE):
-            return self.parse_delete_statement()
-        
-        if self.match(TokenType.IMPORT):
-            return self.parse_import_statement()
-        
-        if self.match(TokenType.EXPORT):
-            return self.parse_export_statement()
-        
-        if self.match(TokenType.REVERSE):
-            self.advance()
-            self.consume_statement_terminator()
-            return ReverseStatement()
-        
-        # Noop statement (any string used as a statement)
-        if self.match(TokenType.STRING):
-            content = self.current_token.value
-            self.advance()
-            self.consume_statement_terminator()
-            return NoopStatement(content)
+        return self.parse_statement_body()
+    
+    def parse_statement_body(self) -> Statement:
+        """Parse the statement starting at the current token."""
+        parser = self._statement_parsers.get(self.current_token.type)
+        if parser is not None:
+            return parser()
         
         # Expression statement
         expr = self.parse_expression()
         priority, is_debug = self.consume_statement_terminator()
         return ExpressionStatement(expr, priority, is_debug)
     
+    def parse_async_function_declaration(self) -> Statement:
+        """Parse async function declaration."""
+        self.advance()  # consume 'async'
+        
+        if self.match_any(_FUNCTION_KEYWORDS):
+            func_decl = self.parse_function_declaration()
+            func_decl.is_async = True
+            return func_decl
+        
+        # Not a function: parse whatever statement follows
+        return self.parse_statement_body()
+    
+    def parse_reverse_statement(self) -> ReverseStatement:
+        """Parse reverse statement."""
+        self.advance()  # consume 'reverse'
+        self.consume_statement_terminator()
+        return ReverseStatement()
+    
+    def parse_noop_statement(self) -> NoopStatement:
+        """Parse noop statement (any string used as a statement)."""
+        content = self.current_token.value
+        self.advance()
+        self.consume_statement_terminator()
+        return NoopStatement(content)
+    
     def consume_statement_terminator(self) -> tuple[int, bool]:
         """Consume statement terminator (! or ?) and return priority and debug flag."""
         priority = 0
         is_debug = False
         
-        if self.match(TokenType.EXCLAMATION):
-            priority = self.current_token.priority
-            self.advance()
-        elif self.match(TokenType.INVERTED_EXCLAMATION):
-            priority = self.current_token.priority
+        token = self.current_token
+        token_type = token.type
+        if token_type == _EXCLAMATION or token_type == _INVERTED_EXCLAMATION:
+            priority = token.priority
             self.advance()
-        elif self.match(TokenType.QUESTION):
+        elif token_type == _QUESTION:
             is_debug = True
-            self.advance()
+            token = self.advance()
             # Handle multiple question marks
-            while self.match(TokenType.QUESTION):
-                self.advance()
+            while token.type == _QUESTION:
+                token = self.advance()
         
         return priority, is_debug
     
@@ -195,7 +325,7 @@ class DreamBerdParser:
         var_count = 0
         
         # Count const and var keywords
-        while self.match(TokenType.CONST, TokenType.VAR):
+        while self.match_any(_CONST_OR_VAR):
             if self.match(TokenType.CONST):
                 const_count += 1
             else:
@@ -244,13 +374,14 @@ class DreamBerdParser:
         parameters = []
         if self.match(TokenType.LPAREN):
             self.advance()
+            append = parameters.append
             
             while not self.match(TokenType.RPAREN):
                 if parameters:  # Not first parameter
                     self.consume(TokenType.COMMA, "Expected ',' between parameters")
                 
                 param_token = self.consume(TokenType.IDENTIFIER, "Expected parameter name")
-                parameters.append(param_token.value)
+                append(param_token.value)
             
             self.consume(TokenType.RPAREN, "Expected ')' after parameters")
         
@@ -261,16 +392,7 @@ class DreamBerdParser:
         if self.match(TokenType.LBRACE):
             # Block body
             self.advance()
-            body = []
-            
-            while not self.match(TokenType.RBRACE):
-                self.skip_newlines()
-                if self.match(TokenType.RBRACE):
-                    break
-                stmt = self.parse_statement()
-                if stmt:
-                    body.append(stmt)
-            
+            body = self.parse_block()
             self.consume(TokenType.RBRACE, "Expected '}' after function body")
         else:
             # Expression body
@@ -292,15 +414,7 @@ class DreamBerdParser:
         # Class body
         self.consume(TokenType.LBRACE, "Expected '{' after class name")
         
-        body = []
-        while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
-            if self.match(TokenType.RBRACE):
-                break
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-        
+        body = self.parse_block()
         self.consume(TokenType.RBRACE, "Expected '}' after class body")
         
         return ClassDeclaration(keyword, name, body)
@@ -315,15 +429,7 @@ class DreamBerdParser:
         
         self.consume(TokenType.LBRACE, "Expected '{' after if condition")
         
-        then_body = []
-        while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
-            if self.match(TokenType.RBRACE):
-                break
-            stmt = self.parse_statement()
-            if stmt:
-                then_body.append(stmt)
-        
+        then_body = self.parse_block()
         self.consume(TokenType.RBRACE, "Expected '}' after if body")
         
         # Optional else clause
@@ -332,15 +438,7 @@ class DreamBerdParser:
             self.advance()
             self.consume(TokenType.LBRACE, "Expected '{' after 'else'")
             
-            else_body = []
-            while not self.match(TokenType.RBRACE):
-                self.skip_newlines()
-                if self.match(TokenType.RBRACE):
-                    break
-                stmt = self.parse_statement()
-                if stmt:
-                    else_body.append(stmt)
-            
+            else_body = self.parse_block()
             self.consume(TokenType.RBRACE, "Expected '}' after else body")
         
         return IfStatement(condition, then_body, else_body)
@@ -355,25 +453,20 @@ class DreamBerdParser:
         
         self.consume(TokenType.LBRACE, "Expected '{' after when condition")
         
-        body = []
-        while not self.match(TokenType.RBRACE):
-            self.skip_newlines()
-            if self.match(TokenType.RBRACE):
-                break
-            stmt = self.parse_statement()
-            if stmt:
-                body.append(stmt)
-        
+        body = self.parse_block()
         self.consume(TokenType.RBRACE, "Expected '}' after when body")
         
         return WhenStatement(condition, body)
     
     def parse_return_statement(self) -> ReturnStatement:
         """Parse return statement."""
+        return_line = self.current_token.line
         self.advance()  # consume 'return'
         
+        # A bare return ends at the terminator or the end of its line
         value = None
-        if not self.match(TokenType.EXCLAMATION, TokenType.QUESTION, TokenType.NEWLINE, TokenType.EOF):
+        token = self.current_token
+        if token.type not in _RETURN_END and token.line == return_line:
             value = self.parse_expression()
         
         self.consume_statement_terminator()
@@ -415,128 +508,61 @@ class DreamBerdParser:
     
     def parse_expression(self) -> Expression:
         """Parse expression with operator precedence."""
-        return self.parse_assignment()
-    
-    def parse_assignment(self) -> Expression:
-        """Parse assignment expressions."""
-        expr = self.parse_or()
-        
-        # Only treat single = as assignment in specific contexts (variable declarations, etc.)
-        # In expressions, single = is very loose equality
-        return expr
-    
-    def parse_or(self) -> Expression:
-        """Parse logical OR expressions."""
-        expr = self.parse_and()
-        
-        while self.match(TokenType.OR):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_and()
-            expr = BinaryOperation(expr, operator, right)
-        
-        return expr
-    
-    def parse_and(self) -> Expression:
-        """Parse logical AND expressions."""
-        expr = self.parse_equality()
-        
-        while self.match(TokenType.AND):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_equality()
-            expr = BinaryOperation(expr, operator, right)
-        
-        return expr
-    
-    def parse_equality(self) -> Expression:
-        """Parse equality expressions."""
-        expr = self.parse_comparison()
-        
-        while self.match(TokenType.ASSIGN, TokenType.LOOSE_EQUAL, TokenType.STRICT_EQUAL, 
-                        TokenType.SUPER_STRICT_EQUAL, TokenType.VERY_LOOSE_EQUAL,
-                        TokenType.NOT_EQUAL):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_comparison()
-            expr = BinaryOperation(expr, operator, right)
-        
-        return expr
-    
-    def parse_comparison(self) -> Expression:
-        """Parse comparison expressions."""
-        expr = self.parse_addition()
-        
-        while self.match(TokenType.LESS_THAN, TokenType.GREATER_THAN,
-                        TokenType.LESS_EQUAL, TokenType.GREATER_EQUAL):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_addition()
-            expr = BinaryOperation(expr, operator, right)
-        
-        return expr
+        # Single = is only assignment in declarations; in expressions it is
+        # very loose equality, handled with the other binary operators
+        return self.parse_binary()
     
-    def parse_addition(self) -> Expression:
-        """Parse addition and subtraction with spacing precedence."""
-        expr = self.parse_multiplication()
-        
-        while self.match(TokenType.PLUS, TokenType.MINUS):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_multiplication()
-            expr = BinaryOperation(expr, operator, right)
-        
-        return expr
-    
-    def parse_multiplication(self) -> Expression:
-        """Parse multiplication, division, and modulo."""
-        expr = self.parse_power()
-        
-        while self.match(TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULO):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_power()
-            expr = BinaryOperation(expr, operator, right)
-        
-        return expr
-    
-    def parse_power(self) -> Expression:
-        """Parse power expressions."""
+    def parse_binary(self, min_precedence: int = 1) -> Expression:
+        """Parse binary operators by precedence climbing over _BINARY_PRECEDENCE."""
         expr = self.parse_unary()
         
-        while self.match(TokenType.POWER):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_unary()
-            expr = BinaryOperation(expr, operator, right)
+        # An operator on a new line starts the next statement, not a right operand
+        operator = self.current_token
+        precedence = _BINARY_PRECEDENCE.get(operator.type, 0)
+        while precedence >= min_precedence and not self.on_new_line():
+            self.advance()
+            # Only tighter operators may bind the right operand (left-associative)
+            right = self.parse_binary(precedence + 1)
+            op = operator.value
+            if operator.type not in _CHAIN_OPERATORS:
+                expr = BinaryOperation(expr, op, right)
+            elif type(expr) is NAryOperation and expr.operator == op:
+                expr.operands.append(right)
+            elif type(expr) is BinaryOperation and expr.operator == op:
+                expr = NAryOperation(op, [expr.left, expr.right, right])
+            else:
+                expr = BinaryOperation(expr, op, right)
+            operator = self.current_token
+            precedence = _BINARY_PRECEDENCE.get(operator.type, 0)
         
         return expr
     
     def parse_unary(self) -> Expression:
         """Parse unary expressions."""
-        if self.match(TokenType.NOT, TokenType.MINUS, TokenType.PLUS):
-            operator = self.current_token.value
+        token = self.current_token
+        token_type = token.type
+        if token_type in _UNARY_OPERATORS:
             self.advance()
             operand = self.parse_unary()
-            return UnaryOperation(operator, operand)
+            return UnaryOperation(token.value, operand)
         
         # Temporal operators
-        if self.match(TokenType.PREVIOUS):
+        if token_type == _PREVIOUS:
             self.advance()
             target = self.parse_unary()
             return PreviousExpression(target)
         
-        if self.match(TokenType.NEXT):
+        if token_type == _NEXT:
             self.advance()
             target = self.parse_unary()
             return NextExpression(target)
         
-        if self.match(TokenType.CURRENT):
+        if token_type == _CURRENT:
             self.advance()
             target = self.parse_unary()
             return CurrentExpression(target)
         
-        if self.match(TokenType.AWAIT):
+        if token_type == _AWAIT:
             self.advance()
             expr = self.parse_unary()
             return AwaitExpression(expr)
@@ -548,29 +574,38 @@ class DreamBerdParser:
         expr = self.parse_primary()
         
         while True:
-            if self.match(TokenType.DOT):
+            token_type = self.current_token.type
+            if token_type == _DOT:
+                # A '.', '[' or '(' on a new line starts the next statement
+                if self.on_new_line():
+                    break
                 self.advance()
                 prop_token = self.consume(TokenType.IDENTIFIER, "Expected property name after '.'")
                 expr = MemberAccess(expr, prop_token.value)
             
-            elif self.match(TokenType.LBRACKET):
+            elif token_type == _LBRACKET:
+                if self.on_new_line():
+                    break
                 self.advance()
                 index = self.parse_expression()
-                self.consume(TokenType.RBRACKET, "Expected ']' after array index")
+                self.consume(_RBRACKET, "Expected ']' after array index")
                 expr = ArrayAccess(expr, index)
             
-            elif self.match(TokenType.LPAREN):
+            elif token_type == _LPAREN:
                 # Function call
+                if self.on_new_line():
+                    break
                 self.advance()
                 
                 arguments = []
-                while not self.match(TokenType.RPAREN):
+                append = arguments.append
+                while not self.match(_RPAREN):
                     if arguments:  # Not first argument
-                        self.consume(TokenType.COMMA, "Expected ',' between arguments")
+                        self.consume(_COMMA, "Expected ',' between arguments")
                     
-                    arguments.append(self.parse_expression())
+                    append(self.parse_expression())
                 
-                self.consume(TokenType.RPAREN, "Expected ')' after function arguments")
+                self.consume(_RPAREN, "Expected ')' after function arguments")
                 expr = FunctionCall(expr, arguments)
             
             else:
@@ -580,124 +615,129 @@ class DreamBerdParser:
     
     def parse_primary(self) -> Expression:
         """Parse primary expressions."""
-        # Numbers
-        if self.match(TokenType.NUMBER):
-            value = self.current_token.value
-            self.advance()
-            
-            # Handle fractions
-            if '/' in value:
-                return NumberLiteral(value)  # Keep as string for evaluation
-            
-            # Try to convert to int or float
-            try:
-                if '.' in value:
-                    return NumberLiteral(float(value))
-                else:
-                    return NumberLiteral(int(value))
-            except ValueError:
-                return NumberLiteral(value)  # Keep as string if conversion fails
-        
-        # Strings
-        if self.match(TokenType.STRING):
-            value = self.current_token.value
-            self.advance()
-            return StringLiteral(value)
-        
-        # Booleans
-        if self.match(TokenType.BOOLEAN):
-            value = self.current_token.value.lower() in ('true', 'True')
-            self.advance()
-            return BooleanLiteral(value)
+        token = self.current_token
+        parser = self._primary_parsers.get(token.type)
+        if parser is None:
+            raise ParseError(f"Unexpected token {token.type}", token)
+        return parser()
+    
+    def parse_number_literal(self) -> NumberLiteral:
+        """Parse number literal."""
+        token = self.current_token
+        self.advance()
+        node = _SMALL_INTS.get(token.value)
+        if node is None:
+            node = NumberLiteral(_NUMBER_CONVERTERS[token.subtype](token.value))
+        return node
+    
+    def parse_string_literal(self) -> StringLiteral:
+        """Parse string literal."""
+        value = self.current_token.value
+        self.advance()
+        return StringLiteral(value)
+    
+    def parse_boolean_literal(self) -> BooleanLiteral:
+        """Parse boolean literal."""
+        value = self.current_token.value.lower() in ('true', 'True')
+        self.advance()
+        return _TRUE if value else _FALSE
+    
+    def parse_maybe_literal(self) -> MaybeLiteral:
+        """Parse maybe literal."""
+        self.advance()
+        return _MAYBE
+    
+    def parse_identifier(self) -> Expression:
+        """Parse identifier, including the special undefined and null literals."""
+        name = self.current_token.value
+        self.advance()
         
-        # Maybe
-        if self.match(TokenType.MAYBE):
-            self.advance()
-            return MaybeLiteral()
+        # Special literals
+        if name == 'undefined':
+            return _UNDEFINED
+        elif name == 'null':
+            return _NULL
         
-        # Identifiers
-        if self.match(TokenType.IDENTIFIER):
-            name = self.current_token.value
-            self.advance()
-            
-            # Special literals
-            if name == 'undefined':
-                return UndefinedLiteral()
-            elif name == 'null':
-                return NullLiteral()
-            
-            return Identifier(name)
+        return Identifier(name)
+    
+    def parse_array_literal(self) -> ArrayLiteral:
+        """Parse array literal."""
+        self.advance()
         
-        # Arrays
-        if self.match(TokenType.LBRACKET):
-            self.advance()
+        elements = []
+        append = elements.append
+        while not self.match(_RBRACKET):
+            if elements:  # Not first element
+                self.consume(_COMMA, "Expected ',' between array elements")
             
-            elements = []
-            while not self.match(TokenType.RBRACKET):
-                if elements:  # Not first element
-                    self.consume(TokenType.COMMA, "Expected ',' between array elements")
-                
-                elements.append(self.parse_expression())
-            
-            self.consume(TokenType.RBRACKET, "Expected ']' after array elements")
-            return ArrayLiteral(elements)
-        
-        # Parentheses (remember: they do nothing in DreamBerd!)
-        if self.match(TokenType.LPAREN):
-            self.advance()
-            expr = self.parse_expression()
-            self.consume(TokenType.RPAREN, "Expected ')' after expression")
-            return expr
+            append(self.parse_expression())
         
-        # Use expression (signals)
-        if self.match(TokenType.USE):
-            self.advance()
-            self.consume(TokenType.LPAREN, "Expected '(' after 'use'")
-            initial_value = self.parse_expression()
-            self.consume(TokenType.RPAREN, "Expected ')' after use argument")
-            return UseExpression(initial_value)
-        
-        # New expression
-        if self.match(TokenType.NEW):
-            self.advance()
-            class_name_token = self.consume(TokenType.IDENTIFIER, "Expected class name after 'new'")
-            
-            self.consume(TokenType.LPAREN, "Expected '(' after class name")
-            
-            arguments = []
-            while not self.match(TokenType.RPAREN):
-                if arguments:
-                    self.consume(TokenType.COMMA, "Expected ',' between arguments")
-                arguments.append(self.parse_expression())
-            
-            self.consume(TokenType.RPAREN, "Expected ')' after new arguments")
-            
-            return NewExpression(class_name_token.value, arguments)
+        self.consume(_RBRACKET, "Expected ']' after array elements")
+        return ArrayLiteral(elements)
+    
+    def parse_parenthesized_expression(self) -> Expression:
+        """Parse parentheses (remember: they do nothing in DreamBerd!)."""
+        self.advance()
+        expr = self.parse_expression()
+        self.consume(TokenType.RPAREN, "Expected ')' after expression")
+        return expr
+    
+    def parse_use_expression(self) -> UseExpression:
+        """Parse use expression (signals)."""
+        self.advance()
+        self.consume(TokenType.LPAREN, "Expected '(' after 'use'")
+        initial_value = self.parse_expression()
+        self.consume(TokenType.RPAREN, "Expected ')' after use argument")
+        return UseExpression(initial_value)
+    
+    def parse_new_expression(self) -> NewExpression:
+        """Parse new expression."""
+        self.advance()
+        class_name_token = self.consume(TokenType.IDENTIFIER, "Expected class name after 'new'")
         
-        # Print is handled as a regular identifier/function
-        if self.match(TokenType.PRINT):
-            self.advance()
-            return Identifier('print')
+        self.consume(_LPAREN, "Expected '(' after class name")
         
-        # Prefix increment
-        if self.match(TokenType.INCREMENT):
-            self.advance()
-            target = self.parse_primary()
-            return IncrementExpression(target, is_prefix=True)
+        arguments = []
+        append = arguments.append
+        while not self.match(_RPAREN):
+            if arguments:
+                self.consume(_COMMA, "Expected ',' between arguments")
+            append(self.parse_expression())
         
-        # Prefix decrement
-        if self.match(TokenType.DECREMENT):
-            self.advance()
-            target = self.parse_primary()
-            return DecrementExpression(target, is_prefix=True)
+        self.consume(_RPAREN, "Expected ')' after new arguments")
         
-        raise ParseError(f"Unexpected token {self.current_token.type}", self.current_token)
+        return NewExpression(class_name_token.value, arguments)
+    
+    def parse_print_identifier(self) -> Identifier:
+        """Print is handled as a regular identifier/function."""
+        self.advance()
+        return _PRINT
+    
+    def parse_prefix_increment(self) -> IncrementExpression:
+        """Parse prefix increment."""
+        self.advance()
+        target = self.parse_primary()
+        return IncrementExpression(target, is_prefix=True)
+    
+    def parse_prefix_decrement(self) -> DecrementExpression:
+        """Parse prefix decrement."""
+        self.advance()
+        target = self.parse_primary()
+        return DecrementExpression(target, is_prefix=True)
 
 
-def parse_dreamberd(source: str) -> Program:
-    """Parse DreamBerd source code into an AST."""
-    lexer = DreamBerdLexer(source)
-    tokens = lexer.tokenize()
+@lru_cache(maxsize=64)
+def parse_dreamberd(source: str, cache_tokens: bool = False) -> Program:
+    """Parse DreamBerd source code into an AST.
+    
+    Results are memoised per source, so repeat calls (REPL lines, reruns of a
+    file) share one Program; callers must treat the AST as read-only.
+    """
+    if cache_tokens:
+        tokens = DreamBerdLexer.tokenize_cached(source)
+    else:
+        lexer = DreamBerdLexer(source)
+        tokens = lexer.tokenize()
     
     parser = DreamBerdParser(tokens)
     return parser.parse()
\ No newline at end of file
@@ -4,10 +4,15 @@ DreamBerd Test Runner
 Runs all individual .db test files and reports results
 """
 
+import argparse
+import json
 import os
+import signal
 import sys
-import glob
-import traceback
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
 from pathlib import Path
 
 # Add src directory to path so we can import dreamberd
@@ -16,30 +21,55 @@ sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(
 from dreamberd import run_dreamberd
 
 
+# Report separators, built once rather than per test
+_BANNER60 = '=' * 60
+_BANNER70 = '=' * 70
+_SEP40 = '-' * 40
+
+
 class TestResult:
     def __init__(self):
         self.passed = 0
         self.failed = 0
         self.errors = []
         self.expected_failures = 0  # Tests that are supposed to fail
+        self.records = []  # One dict per test, for --json
+    
+    def record(self, test_name, status, error=None, duration_ms=None):
+        self.records.append({
+            'test_name': test_name,
+            'status': status,
+            'error': error,
+            'duration_ms': duration_ms,
+        })
     
-    def add_pass(self):
+    def add_pass(self, test_name, duration_ms=None):
         self.passed += 1
+        self.record(test_name, 'passed', duration_ms=duration_ms)
     
-    def add_fail(self, test_name, error):
+    def add_fail(self, test_name, error, duration_ms=None):
         self.failed += 1
         self.errors.append((test_name, error))
+        self.record(test_name, 'failed', error, duration_ms)
     
-    def add_expected_fail(self):
+    def add_expected_fail(self, test_name, error=None, duration_ms=None):
         self.expected_failures += 1
+        self.record(test_name, 'expected_failure', error, duration_ms)
+    
+    def merge(self, other):
+        self.passed += other.passed
+        self.failed += other.failed
+        self.errors.extend(other.errors)
+        self.expected_failures += other.expected_failures
+        self.records.extend(other.records)
     
     def summary(self):
         total = self.passed + self.failed + self.expected_failures
         success_rate = (self.passed + self.expected_failures) / total * 100 if total > 0 else 0
         
-        print(f"\n{'='*70}")
-        print(f"DREAMBER TEST SUITE SUMMARY")
-        print(f"{'='*70}")
+        print('\n' + _BANNER70)
+        print("DREAMBER TEST SUITE SUMMARY")
+        print(_BANNER70)
         print(f"Total tests: {total}")
         print(f"✅ Passed: {self.passed}")
         print(f"❌ Failed: {self.failed}")
@@ -54,39 +84,46 @@ class TestResult:
                 print()
 
 
-def get_expected_output(file_path):
-    """Extract expected output from test file comments"""
+_EXPECTED_MARKER = '// Expected:'
+
+# Default expected output for tests without an "// Expected:" comment, as
+# (filename substring, expected) pairs; the first matching pattern wins
+_EXPECTED_BY_FILENAME = (
+    ('hello_world', "Hello world"),
+    ('exclamation', "Hello world"),
+    ('const_const_const', "3.14"),
+    ('arrays_negative_one', "3"),
+    ('functions', "5"),
+    ('divide_by_zero', "undefined"),
+    ('number_names', "3"),
+    ('equality', "true"),
+    ('fractions', "0.5"),
+    ('increment_decrement', "6"),
+    ('multiline_string_operators', "False"),
+)
+
+
+@lru_cache(maxsize=None)
+def _expected_from_filename(filename):
+    """Default expected output for a test file name, or None"""
+    for pattern, expected in _EXPECTED_BY_FILENAME:
+        if pattern in filename:
+            return expected
+    return None
+
+
+def get_expected_output(filename, content):
+    """Extract expected output from the test file's already-read content"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Look for // Expected: output comments
-        lines = content.split('\n')
-        for line in lines:
-            if '// Expected:' in line:
-                return line.split('// Expected:', 1)[1].strip()
+        # Look for // Expected: output comments; the rest of that line is the output
+        marker = content.find(_EXPECTED_MARKER)
+        if marker != -1:
+            start = marker + len(_EXPECTED_MARKER)
+            end = content.find('\n', start)
+            return content[start:end if end != -1 else None].strip()
         
         # Default expectations based on filename patterns
-        filename = os.path.basename(file_path)
-        
-        if 'hello_world' in filename or 'exclamation' in filename:
-            return "Hello world"
-        elif 'const_const_const' in filename:
-            return "3.14"
-        elif 'arrays_negative_one' in filename:
-            return "3"
-        elif 'functions' in filename:
-            return "5"
-        elif 'divide_by_zero' in filename:
-            return "undefined"
-        elif 'number_names' in filename:
-            return "3"
-        elif 'equality' in filename:
-            return "true"
-        elif 'fractions' in filename:
-            return "0.5"
-        elif 'increment_decrement' in filename:
-            return "6"
+        return _expected_from_filename(filename)
             
     except Exception:
         pass
@@ -94,90 +131,176 @@ def get_expected_output(file_path):
     return None
 
 
-def should_fail(file_path):
+# Tests that should fail, by file name without the NN_ number prefix and .db
+_FAIL_TESTS = frozenset({
+    'multiple_class_error',
+    'delete_primitives',
+    'delete_keywords',
+    'multiline_string_call',
+    'multiline_string_index',
+})
+
+
+@lru_cache(maxsize=None)
+def should_fail(filename):
     """Determine if a test is expected to fail"""
-    filename = os.path.basename(file_path)
-    
-    # Tests that should fail
-    fail_tests = [
-        'multiple_class_error',
-        'delete_primitives', 
-        'delete_keywords'
-    ]
-    
-    return any(fail_test in filename for fail_test in fail_tests)
+    stem = Path(filename).stem
+    number, _, name = stem.partition('_')
+    if number.isdigit():
+        stem = name
+    return stem in _FAIL_TESTS
 
 
-def run_test_file(file_path, result):
-    """Run a single .db test file"""
+# Lines of each test's source shown in verbose logs (all of it with -vv)
+SOURCE_PREVIEW_LINES = 20
+
+
+def _quiet(*parts):
+    """Drops the per-test detail of quiet runs"""
+
+
+def run_test_file(file_path, result, code=None, verbose=0):
+    """Run a single .db test file, reading it unless its code is given
+    
+    Returns the test's log, collected rather than printed so it can be
+    written out in one go. Verbose logs show the banner, source and output
+    of the test (the source cut to SOURCE_PREVIEW_LINES below level 2);
+    otherwise the log is a single status line.
+    """
     filename = os.path.basename(file_path)
     test_name = filename.replace('.db', '').replace('_', ' ').title()
     
-    print(f"\n{'='*60}")
-    print(f"Running: {test_name}")
-    print(f"File: {filename}")
-    print(f"{'='*60}")
+    log = []
+    if verbose:
+        def detail(*parts):
+            log.append(' '.join(parts) + '\n')
+        report = detail
+    else:
+        detail = _quiet
+        def report(status):
+            log.append(f"{test_name}: {status}\n")
+    
+    detail('\n' + _BANNER60)
+    detail(f"Running: {test_name}")
+    detail(f"File: {filename}")
+    detail(_BANNER60)
+    
+    should_fail_test = should_fail(filename)
+    
+    # Time spent in run_dreamberd, in milliseconds; None if it never started
+    started = None
+    def elapsed():
+        if started is None:
+            return None
+        return round((time.perf_counter() - started) * 1000, 3)
     
     try:
         # Read the test file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            code = f.read()
+        if code is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                code = f.read()
         
-        print(f"Code:")
-        print(code)
-        print("-" * 40)
+        detail(f"Code:")
+        lines = code.splitlines() if verbose else ()
+        if verbose < 2 and len(lines) > SOURCE_PREVIEW_LINES:
+            detail('\n'.join(lines[:SOURCE_PREVIEW_LINES]))
+            detail(f"... ({len(lines) - SOURCE_PREVIEW_LINES} more lines elided)")
+        else:
+            detail(code)
+        detail(_SEP40)
         
-        expected_output = get_expected_output(file_path)
-        should_fail_test = should_fail(file_path)
+        expected_output = get_expected_output(filename, code)
         
         if should_fail_test:
-            print("⚠️  This test is expected to fail")
+            detail("⚠️  This test is expected to fail")
         
         # Run the DreamBerd code
+        started = time.perf_counter()
         output = run_dreamberd(code)
+        duration_ms = elapsed()
         
         if should_fail_test:
-            print("❌ Test should have failed but passed")
+            report("❌ Test should have failed but passed")
             if output:
-                print("Output:", '\n'.join(output))
-            result.add_fail(test_name, "Expected failure but test passed")
-            return
+                detail("Output:", '\n'.join(output))
+            result.add_fail(test_name, "Expected failure but test passed", duration_ms)
+            return ''.join(log)
         
         # Check output
         if output:
             output_str = '\n'.join(output)
-            print("Output:", output_str)
+            detail("Output:", output_str)
             
             if expected_output and expected_output in output_str:
-                print("✅ PASSED")
-                result.add_pass()
+                report("✅ PASSED")
+                result.add_pass(test_name, duration_ms)
             elif expected_output:
-                print(f"❌ FAILED - Expected '{expected_output}' but got '{output_str}'")
-                result.add_fail(test_name, f"Expected '{expected_output}' but got '{output_str}'")
+                report(f"❌ FAILED - Expected '{expected_output}' but got '{output_str}'")
+                result.add_fail(test_name, f"Expected '{expected_output}' but got '{output_str}'", duration_ms)
             else:
-                print("✅ PASSED (no specific output expected)")
-                result.add_pass()
+                report("✅ PASSED (no specific output expected)")
+                result.add_pass(test_name, duration_ms)
         else:
-            print("Output: (no output)")
+            detail("Output: (no output)")
             if expected_output:
-                print(f"❌ FAILED - Expected '{expected_output}' but got no output")
-                result.add_fail(test_name, f"Expected '{expected_output}' but got no output")
+                report(f"❌ FAILED - Expected '{expected_output}' but got no output")
+                result.add_fail(test_name, f"Expected '{expected_output}' but got no output", duration_ms)
             else:
-                print("✅ PASSED")
-                result.add_pass()
+                report("✅ PASSED")
+                result.add_pass(test_name, duration_ms)
                 
     except Exception as e:
-        if should_fail(file_path):
-            print(f"✅ EXPECTED FAILURE: {e}")
-            result.add_expected_fail()
+        if should_fail_test:
+            report(f"✅ EXPECTED FAILURE: {e}")
+            result.add_expected_fail(test_name, str(e), elapsed())
         else:
             error_msg = str(e)
-            print(f"❌ ERROR: {error_msg}")
-            result.add_fail(test_name, error_msg)
+            report(f"❌ ERROR: {error_msg}")
+            result.add_fail(test_name, error_msg, elapsed())
+    
+    return ''.join(log)
+
+
+# Seconds an expected-failure test may run; a runaway one is stopped with an
+# error, which counts as its expected failure
+EXPECTED_FAILURE_TIMEOUT = 2
+
+
+def _raise_timeout(signum, frame):
+    raise TimeoutError(f"Timed out after {EXPECTED_FAILURE_TIMEOUT}s")
+
+
+def run_test_in_worker(file_path, code=None, verbose=0, timeout=None):
+    """Run a single .db test file in a pool worker, returning its log and result"""
+    result = TestResult()
+    # The alarm interrupts the interpreter inside run_test_file, whose
+    # error handling then records the outcome (Unix only)
+    if timeout and hasattr(signal, 'SIGALRM'):
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.alarm(timeout)
+        try:
+            log = run_test_file(file_path, result, code, verbose)
+        finally:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, previous_handler)
+    else:
+        log = run_test_file(file_path, result, code, verbose)
+    return log, result
 
 
 def main():
     """Run all DreamBerd test files"""
+    parser = argparse.ArgumentParser(description='DreamBerd test suite runner')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='print the banner, source and output of every test; sources are '
+                             f'cut to {SOURCE_PREVIEW_LINES} lines unless given twice (-vv)')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='stop at the first unexpected failure and skip the remaining tests')
+    parser.add_argument('--json', metavar='PATH',
+                        help='also write every test\'s name, status, error and duration_ms '
+                             'to PATH as a JSON list')
+    args = parser.parse_args()
+    
     print("🚀 DreamBerd Test Suite Runner")
     print("Running all individual .db test files...")
     
@@ -189,8 +312,11 @@ def main():
         print(f"❌ Features directory not found: {features_dir}")
         return
     
-    # Find all .db files
-    test_files = sorted(glob.glob(str(features_dir / "*.db")))
+    # Find all .db files; directory entries carry their type, so no stat per file
+    with os.scandir(features_dir) as entries:
+        test_files = sorted(entry.path for entry in entries
+                            if entry.name.endswith('.db') and not entry.name.startswith('.')
+                            and entry.is_file())
     
     if not test_files:
         print(f"❌ No .db test files found in {features_dir}")
@@ -198,15 +324,60 @@ def main():
     
     print(f"Found {len(test_files)} test files")
     
+    # Read every test file once, up front, so workers only receive text. A
+    # file that can't be read is left to its worker, which reports the error
+    # as that test's failure
+    contents = {}
+    for test_file in test_files:
+        try:
+            with open(test_file, 'r', encoding='utf-8') as f:
+                contents[test_file] = f.read()
+        except (OSError, UnicodeDecodeError):
+            contents[test_file] = None
+    
     result = TestResult()
     
-    # Run each test file
+    # Tests are independent, so run them across worker processes. Workers
+    # persist for the whole run, importing the interpreter once. Regular tests
+    # go out in chunks to cut per-test dispatch; the expected-failure tests
+    # are queued after them one at a time, each under a timeout
+    expected_to_fail = {test_file for test_file in test_files if should_fail(os.path.basename(test_file))}
+    positive_files = [test_file for test_file in test_files if test_file not in expected_to_fail]
+    negative_files = [test_file for test_file in test_files if test_file in expected_to_fail]
+    max_workers = max(1, (os.cpu_count() or 1) - 2)
+    chunksize = max(1, len(positive_files) // (4 * max_workers))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        positive = executor.map(run_test_in_worker, positive_files,
+                                [contents[test_file] for test_file in positive_files],
+                                repeat(args.verbose), chunksize=chunksize)
+        negative = executor.map(run_test_in_worker, negative_files,
+                                [contents[test_file] for test_file in negative_files],
+                                repeat(args.verbose), repeat(EXPECTED_FAILURE_TIMEOUT))
+        outcomes = {}
+        for test_file, outcome in chain(zip(positive_files, positive), zip(negative_files, negative)):
+            outcomes[test_file] = outcome
+            if args.fail_fast and outcome[1].failed:
+                # Drop every test that hasn't started; running ones finish
+                executor.shutdown(cancel_futures=True)
+                break
+    
+    # Logs are written and results merged in file order, keeping the report stable
     for test_file in test_files:
-        run_test_file(test_file, result)
+        if test_file in outcomes:
+            log, test_result = outcomes[test_file]
+            sys.stdout.write(log)
+            result.merge(test_result)
+    
+    if len(outcomes) < len(test_files):
+        print(f"\n⏹️  Stopped at the first failure (--fail-fast); {len(test_files) - len(outcomes)} tests skipped")
     
     # Show summary
     result.summary()
     
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result.records, f, indent=2, ensure_ascii=False)
+    
     # Exit with appropriate code
     if result.failed > 0:
         sys.exit(1)